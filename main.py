@@ -23,25 +23,6 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.engine import FraudEngine
-from src.loader import (
-    compute_user_device_map,
-    dataframe_to_transactions,
-    load_dataset,
-)
-from src.dashboard import generate_dashboard
-from src.reporting import generate_json_report, print_console_report
-from src.rules import (
-    ForeignTxRule,
-    HighAmountRule,
-    LocationChangeRule,
-    NewDeviceRule,
-    OddHoursRule,
-    UnusualAmountRule,
-    VelocityRule,
-)
-from src.utils import load_config, setup_logging
-
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command-line arguments.
@@ -67,6 +48,23 @@ def main() -> None:
     args = parse_arguments()
     start_time = time.time()
 
+    # Pipeline modules are imported only after argument parsing so that
+    # `--help` does not pay for pandas and the reporting stack.
+    from src.dashboard import generate_dashboard
+    from src.engine import FraudEngine
+    from src.loader import compute_user_device_map, load_dataset
+    from src.reporting import generate_json_report, print_console_report
+    from src.rules import (
+        ForeignTxRule,
+        HighAmountRule,
+        LocationChangeRule,
+        NewDeviceRule,
+        OddHoursRule,
+        UnusualAmountRule,
+        VelocityRule,
+    )
+    from src.utils import load_config, setup_logging
+
     # ── Step 1: Load configuration ──────────────────────────────────────
     try:
         config = load_config(args.config)
@@ -94,13 +92,7 @@ def main() -> None:
     # ── Step 4: Compute auxiliary data structures ───────────────────────
     user_device_map = compute_user_device_map(df)
 
-    # ── Step 5: Convert DataFrame to Transaction objects ────────────────
-    transactions = dataframe_to_transactions(df)
-    if not transactions:
-        logger.error("No valid transactions to process. Exiting.")
-        sys.exit(1)
-
-    # ── Step 6: Initialize the engine and register rules ────────────────
+    # ── Step 5: Initialize the engine and register rules ────────────────
     engine = FraudEngine(config)
     rules_config = config["rules"]
 
@@ -115,24 +107,24 @@ def main() -> None:
         NewDeviceRule(rules_config["new_device"]),
     ])
 
-    # ── Step 7: Evaluate all transactions ───────────────────────────────
-    evaluated = engine.evaluate_all(
-        transactions,
-        user_device_map=user_device_map,
-    )
+    # ── Step 6: Convert and evaluate all transactions ───────────────────
+    evaluated = engine.evaluate_dataframe(df, user_device_map=user_device_map)
+    if not evaluated:
+        logger.error("No valid transactions to process. Exiting.")
+        sys.exit(1)
 
-    # ── Step 8: Extract fraud alerts ────────────────────────────────────
-    alerts = engine.get_alerts(evaluated)
+    # ── Step 7: Extract fraud alerts ────────────────────────────────────
+    alerts = engine.get_alerts(evaluated, scores=engine.scores)
 
-    # ── Step 9: Generate reports ────────────────────────────────────────
+    # ── Step 8: Generate reports ────────────────────────────────────────
     generate_json_report(engine, evaluated, alerts, output_file)
     print_console_report(engine, evaluated, alerts)
 
-    # ── Step 9b: Generate interactive dashboard ─────────────────────────
+    # ── Step 8b: Generate interactive dashboard ─────────────────────────
     dashboard_path = generate_dashboard(engine, evaluated, alerts, "dashboard.html")
     logger.info("Interactive dashboard generated: %s", dashboard_path)
 
-    # ── Step 10: Final summary ──────────────────────────────────────────
+    # ── Step 9: Final summary ───────────────────────────────────────────
     elapsed = time.time() - start_time
     logger.info("Pipeline completed in %.2f seconds", elapsed)
     logger.info(
@@ -0,0 +1,133 @@
+"""
+Fused aggregation kernel for the dashboard.
+
+Computes every numeric dashboard breakdown (score distribution, fraud vs
+legit by hour, alert amount ranges and weekend alerts) in a single pass
+over the score, hour, amount and weekend columns.
+
+Numba is an optional dependency: when it is installed the pass is
+JIT-compiled and split across threads; otherwise an equivalent set of
+NumPy reductions is used.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Optional dependency — use the NumPy implementation
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def _aggregate_numpy(
+    scores: np.ndarray,
+    hours: np.ndarray,
+    amounts: np.ndarray,
+    is_weekend: np.ndarray,
+    is_alert: np.ndarray,
+    score_cuts: np.ndarray,
+    amount_cuts: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+    """NumPy implementation of `aggregate` (see its docstring)."""
+    alert_mask = is_alert.astype(bool)
+    bucket_idx = np.searchsorted(score_cuts, scores, side="left")
+    range_idx = np.searchsorted(amount_cuts, amounts[alert_mask], side="right")
+    return (
+        np.bincount(bucket_idx, minlength=len(score_cuts) + 1),
+        np.bincount(hours[alert_mask], minlength=24),
+        np.bincount(hours[~alert_mask], minlength=24),
+        np.bincount(range_idx, minlength=len(amount_cuts) + 1),
+        int(np.count_nonzero(is_weekend[alert_mask] == 1)),
+    )
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(parallel=True, cache=True)
+    def _aggregate_numba(
+        scores, hours, amounts, is_weekend, is_alert, score_cuts, amount_cuts, n_chunks,
+    ):  # pragma: no cover - compiled
+        n = scores.shape[0]
+        chunk = (n + n_chunks - 1) // n_chunks
+
+        # One private row of counters per chunk avoids racing increments
+        buckets = np.zeros((n_chunks, score_cuts.shape[0] + 1), dtype=np.int64)
+        fraud_h = np.zeros((n_chunks, 24), dtype=np.int64)
+        legit_h = np.zeros((n_chunks, 24), dtype=np.int64)
+        ranges = np.zeros((n_chunks, amount_cuts.shape[0] + 1), dtype=np.int64)
+        weekend = np.zeros(n_chunks, dtype=np.int64)
+
+        for c in numba.prange(n_chunks):
+            for i in range(c * chunk, min(n, (c + 1) * chunk)):
+                s = scores[i]
+                b = 0
+                while b < score_cuts.shape[0] and s > score_cuts[b]:
+                    b += 1
+                buckets[c, b] += 1
+
+                if is_alert[i]:
+                    fraud_h[c, hours[i]] += 1
+                    a = amounts[i]
+                    r = 0
+                    while r < amount_cuts.shape[0] and a >= amount_cuts[r]:
+                        r += 1
+                    ranges[c, r] += 1
+                    if is_weekend[i] == 1:
+                        weekend[c] += 1
+                else:
+                    legit_h[c, hours[i]] += 1
+
+        return (
+            buckets.sum(axis=0),
+            fraud_h.sum(axis=0),
+            legit_h.sum(axis=0),
+            ranges.sum(axis=0),
+            weekend.sum(),
+        )
+
+
+def aggregate(
+    scores: np.ndarray,
+    hours: np.ndarray,
+    amounts: np.ndarray,
+    is_weekend: np.ndarray,
+    is_alert: np.ndarray,
+    score_cuts: tuple[int, ...],
+    amount_cuts: tuple[int, ...],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+    """Compute the numeric dashboard breakdowns in one pass.
+
+    Alert-only breakdowns are derived from the full columns through the
+    `is_alert` mask, so they describe exactly the dashboard's alert list.
+
+    Args:
+        scores: Risk score per transaction.
+        hours: Hour of day (0-23) per transaction.
+        amounts: Transaction amount per transaction.
+        is_weekend: Weekend flag (1/0) per transaction.
+        is_alert: int8 flag per transaction, 1 if it is an alert.
+        score_cuts: Inclusive upper bound of each score bucket but the last.
+        amount_cuts: Inclusive lower bound of each amount range but the first.
+
+    Returns:
+        A tuple of (score bucket counts, alerts by hour, non-alerts by
+        hour, alert amount range counts, weekend alert count).
+
+    Raises:
+        ValueError: If an hour falls outside 0-23.
+    """
+    if hours.size and (hours.min() < 0 or hours.max() > 23):
+        raise ValueError("Transaction hours must be within 0-23")
+    score_cuts_arr = np.asarray(score_cuts, dtype=np.int64)
+    amount_cuts_arr = np.asarray(amount_cuts, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        buckets, fraud_h, legit_h, ranges, weekend = _aggregate_numba(
+            scores, hours, amounts, is_weekend, is_alert,
+            score_cuts_arr, amount_cuts_arr, numba.get_num_threads(),
+        )
+        return buckets, fraud_h, legit_h, ranges, int(weekend)
+    return _aggregate_numpy(
+        scores, hours, amounts, is_weekend, is_alert,
+        score_cuts_arr, amount_cuts_arr,
+    )
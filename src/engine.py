@@ -7,13 +7,63 @@ added by registration without modifying engine logic.
 """
 
 import logging
+import multiprocessing
+import os
+import sys
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
-from src.loader import Transaction
+import numpy as np
+import pandas as pd
+
+from src import engine_numba
+from src.loader import (
+    Transaction,
+    TransactionColumns,
+    coerce_dataframe,
+    dataframe_to_columns,
+    dataframe_to_transactions,
+    transactions_to_columns,
+)
 from src.rules import FraudRule
 
 logger = logging.getLogger("fraud_engine.engine")
 
+# Outcome of one transaction evaluated in a worker process:
+# (risk_score, triggered_rules), or None if the transaction was skipped
+_WorkerResult = tuple[int, list[tuple[str, int]]] | None
+
+# Below this many transactions, starting a worker pool and shipping the
+# batch to it costs more than evaluating it sequentially
+PARALLEL_MIN_ROWS = 50_000
+
+# Below this many rows, the fused kernel runs on the calling thread:
+# waking Numba's thread pool costs more than it saves
+PARALLEL_MIN_BATCH = 10_000
+
+# One record per registered rule: kernel threshold, points and kernel
+# slot ("kind", -1 for rules the fused kernel does not cover)
+RULE_TABLE_DTYPE = np.dtype([("th", "f8"), ("pts", "i4"), ("kind", "i1")])
+
+# Source of the per-row scorer generated for a set of built-in rules
+# (see FraudEngine._build_scorer); the rules' constants are parameters
+# of make_scorer, so the scorer reads them as closure variables
+_SCORER_TEMPLATE = """\
+def make_scorer({params}):
+    def scorer(tx, user_device_map=no_devices, **kwargs):
+        score = 0
+        hits = []
+{body}
+        return score, hits
+    return scorer
+"""
+
+# Risk level labels indexed by "score >= critical threshold". Interned and
+# held in an object array, so every classified transaction shares them
+RISK_LEVELS = np.array([sys.intern("HIGH"), sys.intern("CRITICAL")], dtype=object)
+
 
 class FraudEngine:
     """Central orchestrator that evaluates transactions against registered rules.
@@ -25,6 +75,26 @@ class FraudEngine:
         rules: List of registered FraudRule instances.
         alert_threshold: Minimum risk_score to trigger a fraud alert.
         critical_threshold: Score above this level is classified as CRITICAL.
+        safe_mode: Whether rule and transaction errors are logged and
+            skipped (True) or propagated to the caller (False).
+        short_circuit: Whether scoring stops once a transaction reaches
+            the critical threshold. Rules are then evaluated in descending
+            order of points (`rules` keeps registration order). Off by
+            default, since the skipped rules are missing from
+            triggered_rules and statistics.
+        jit_warmup: Whether the fused Numba kernel is compiled (or loaded
+            from its disk cache) when the engine is built, so the first
+            batch of a long-running service does not pay for it.
+        parallel_min_batch: Smallest batch the fused kernel spreads over
+            Numba's thread pool; smaller ones run on one thread.
+        scores: Risk scores of the last batch scored by
+            `evaluate_dataframe` or `evaluate_all_vectorized`, aligned
+            with its result. Reset to None by every other evaluation
+            (row by row, or `evaluate_and_alert`), so it never describes
+            an earlier batch.
+        trigger_bits: Rule triggers of that same batch, one bit per
+            registered rule packed little-endian into uint8 bytes (one
+            row per transaction). Reset together with `scores`.
     """
 
     def __init__(self, config: dict[str, Any]) -> None:
@@ -34,10 +104,30 @@ class FraudEngine:
             config: The full application configuration dictionary.
         """
         self.rules: list[FraudRule] = []
+        # Positions in `rules` in evaluation order, and each rule's name
+        # with its per-row scorer (`FraudRule.fast_eval`) in that order
+        self._rule_order: list[int] = []
+        self._evaluators: list[tuple[str, Callable[..., int]]] = []
+        # The same rules inlined into one generated function, when they allow it
+        self._scorer: Callable[..., tuple[int, list[tuple[str, int]]]] | None = None
+        # Scoring parameters of `rules`, packed once at registration
+        self._rule_table = np.empty(0, dtype=RULE_TABLE_DTYPE)
+        self._points = self._points_vector([])
         alerting_config = config.get("alerting", {})
         self.alert_threshold: int = alerting_config.get("risk_score_threshold", 75)
         self.critical_threshold: int = alerting_config.get("critical_threshold", 120)
+        engine_config = config.get("engine", {})
+        self.safe_mode: bool = bool(engine_config.get("safe_mode", True))
+        self.short_circuit: bool = bool(engine_config.get("short_circuit", False))
+        self.jit_warmup: bool = bool(engine_config.get("jit_warmup", False))
+        self.parallel_min_batch: int = int(
+            engine_config.get("parallel_min_batch", PARALLEL_MIN_BATCH)
+        )
+        self.scores: np.ndarray | None = None
+        self.trigger_bits: np.ndarray | None = None
         self._config = config
+        if self.jit_warmup:
+            engine_numba.warmup()
         logger.info(
             "FraudEngine initialized — alert threshold: %d, critical threshold: %d",
             self.alert_threshold,
@@ -51,6 +141,23 @@ class FraudEngine:
             rule: An instance of a FraudRule subclass.
         """
         self.rules.append(rule)
+        order = range(len(self.rules))
+        if self.short_circuit:
+            # Highest-scoring rules first, so the critical threshold is hit early
+            order = sorted(order, key=lambda j: self.rules[j].points, reverse=True)
+        self._rule_order = list(order)
+        self._evaluators = [
+            (self.rules[j].name, self.rules[j].fast_eval) for j in self._rule_order
+        ]
+        self._scorer = self._build_scorer()
+        self._rule_table = np.array(
+            [
+                (r.kernel_threshold, r.points, -1 if r.fused_slot is None else r.fused_slot)
+                for r in self.rules
+            ],
+            dtype=RULE_TABLE_DTYPE,
+        )
+        self._points = self._points_vector(self._rule_table["pts"].tolist())
         logger.info("Registered rule: %s", rule.name)
 
     def register_rules(self, rules: list[FraudRule]) -> None:
@@ -62,6 +169,48 @@ class FraudEngine:
         for rule in rules:
             self.register_rule(rule)
 
+    def _build_scorer(self) -> Callable[..., tuple[int, list[tuple[str, int]]]] | None:
+        """Generate one function that scores a transaction against every rule.
+
+        Each rule's `row_condition` is inlined in evaluation order, with
+        its threshold, points and triggered_rules entry bound as closure
+        variables, so a row costs a single call instead of one per rule.
+        Only configuration values are bound; no text from them ever
+        becomes part of the generated source.
+
+        Returns:
+            The scorer, taking (transaction, **kwargs) and returning the
+            (risk score, triggered rules) pair; or None if any rule has
+            no `row_condition` for the `evaluate()` it runs.
+        """
+        if any(r.fused_slot is None or r.row_condition is None for r in self.rules):
+            return None
+
+        params: dict[str, Any] = {"no_devices": {}, "stop_at": self.critical_threshold}
+        body: list[str] = []
+        for j in self._rule_order:
+            rule = self.rules[j]
+            if rule.points <= 0:
+                continue
+            params[f"th{j}"] = rule.kernel_threshold
+            params[f"pts{j}"] = rule.points
+            params[f"hit{j}"] = (rule.name, rule.points)
+            body += [
+                f"        if {rule.row_condition.format(th=f'th{j}')}:",
+                f"            score += pts{j}",
+                f"            hits.append(hit{j})",
+            ]
+            if self.short_circuit:
+                body += [
+                    "            if score >= stop_at:",
+                    "                return score, hits",
+                ]
+
+        source = _SCORER_TEMPLATE.format(params=", ".join(params), body="\n".join(body))
+        namespace: dict[str, Any] = {}
+        exec(compile(source, "<fraud-engine scorer>", "exec"), namespace)
+        return namespace["make_scorer"](**params)
+
     def evaluate_transaction(
         self,
         transaction: Transaction,
@@ -69,8 +218,13 @@ class FraudEngine:
     ) -> Transaction:
         """Evaluate a single transaction against all registered rules.
 
-        Each rule is evaluated independently. If a rule raises an exception,
-        the error is logged and the rule is skipped (fail-safe behavior).
+        Each rule is evaluated independently. In safe mode, if a rule
+        raises an exception, the error is logged and the rule is skipped
+        (fail-safe behavior); otherwise the exception propagates. With
+        `short_circuit` enabled, evaluation stops as soon as the score
+        reaches the critical threshold. When every rule is a built-in one,
+        the generated scorer of `_build_scorer` runs them all in one call;
+        if it fails in safe mode, the rules are rerun one by one.
 
         Args:
             transaction: The Transaction to evaluate.
@@ -78,25 +232,50 @@ class FraudEngine:
 
         Returns:
             The same Transaction object, now with populated
-            risk_score and triggered_rules fields.
+            risk_score and triggered_rules fields. Each triggered rule
+            is recorded as a (rule name, score) pair.
         """
+        if self._scorer is not None:
+            try:
+                transaction.risk_score, transaction.triggered_rules = self._scorer(
+                    transaction, **kwargs,
+                )
+                return transaction
+            except Exception:
+                if not self.safe_mode:
+                    raise
+
         transaction.risk_score = 0
         transaction.triggered_rules = []
+        # A score past this bound stops evaluation early
+        stop_at = self.critical_threshold if self.short_circuit else float("inf")
 
-        for rule in self.rules:
+        if not self.safe_mode:
+            for name, evaluate in self._evaluators:
+                score = evaluate(transaction, **kwargs)
+                if score > 0:
+                    transaction.risk_score += score
+                    transaction.triggered_rules.append((name, score))
+                    if transaction.risk_score >= stop_at:
+                        break
+            return transaction
+
+        for name, evaluate in self._evaluators:
             try:
-                score = rule.evaluate(transaction, **kwargs)
+                score = evaluate(transaction, **kwargs)
                 if score > 0:
                     transaction.risk_score += score
-                    rule_label = f"{rule.name}: +{score}"
-                    transaction.triggered_rules.append(rule_label)
+                    transaction.triggered_rules.append((name, score))
+                    if transaction.risk_score >= stop_at:
+                        break
             except Exception as exc:
-                logger.error(
-                    "Rule '%s' failed on tx %s: %s",
-                    rule.name,
-                    transaction.transaction_id,
-                    exc,
-                )
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        "Rule '%s' failed on tx %s: %s",
+                        name,
+                        transaction.transaction_id,
+                        exc,
+                    )
 
         return transaction
 
@@ -117,45 +296,506 @@ class FraudEngine:
         Returns:
             The list of evaluated Transaction objects (with scores populated).
         """
+        self.scores = self.trigger_bits = None
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            logger.info(
+                "Starting batch evaluation — %d transactions, %d rules",
+                len(transactions),
+                len(self.rules),
+            )
+
+        evaluated = self._evaluate_chunk(transactions, **kwargs)
+
+        if info_enabled:
+            logger.info("Batch evaluation complete — %d transactions processed", len(evaluated))
+        return evaluated
+
+    def evaluate_parallel(
+        self,
+        transactions: list[Transaction],
+        max_workers: int | None = None,
+        min_rows: int = PARALLEL_MIN_ROWS,
+        **kwargs: Any,
+    ) -> list[Transaction]:
+        """Evaluate a batch of transactions across a pool of workers.
+
+        Transactions are independent and rules hold no mutable state, so
+        the batch is split into one contiguous chunk per worker. On
+        free-threaded (no-GIL) CPython builds the workers are threads;
+        with the GIL enabled they are processes, each initialized once
+        with the rules and evaluation context. Worker processes send back
+        only scores and triggered rules, which are written onto the
+        caller's Transaction objects. Batches smaller than `min_rows`, or
+        where worker processes cannot be started, are evaluated
+        sequentially.
+
+        Args:
+            transactions: List of Transaction objects to evaluate.
+            max_workers: Number of workers (default: CPU count).
+            min_rows: Smallest batch worth the pool's start-up cost.
+            **kwargs: Additional context passed to rule evaluators.
+                Must be picklable when worker processes are used.
+
+        Returns:
+            The list of evaluated Transaction objects, in input order.
+        """
+        self.scores = self.trigger_bits = None
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(transactions) < max(min_rows, 2 * workers):
+            return self.evaluate_all(transactions, **kwargs)
+
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        mp_context = _worker_context() if gil_enabled else None
+        if gil_enabled and mp_context is None:
+            logger.info("__main__ cannot be re-imported by worker processes — evaluating sequentially")
+            return self.evaluate_all(transactions, **kwargs)
         logger.info(
-            "Starting batch evaluation — %d transactions, %d rules",
+            "Starting parallel evaluation — %d transactions, %d rules, %d %s",
             len(transactions),
             len(self.rules),
+            workers,
+            "processes" if gil_enabled else "threads",
         )
 
+        chunk_size = -(-len(transactions) // workers)
+        chunks = [
+            transactions[i:i + chunk_size]
+            for i in range(0, len(transactions), chunk_size)
+        ]
+        if gil_enabled:
+            evaluated = self._evaluate_in_processes(chunks, workers, mp_context, kwargs)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    lambda chunk: self._evaluate_chunk(chunk, **kwargs), chunks,
+                )
+                evaluated = [tx for chunk in results for tx in chunk]
+
+        logger.info("Parallel evaluation complete — %d transactions processed", len(evaluated))
+        return evaluated
+
+    def _evaluate_in_processes(
+        self,
+        chunks: list[list[Transaction]],
+        workers: int,
+        mp_context: multiprocessing.context.BaseContext,
+        kwargs: dict[str, Any],
+    ) -> list[Transaction]:
+        """Evaluate chunks in worker processes and apply the results.
+
+        Args:
+            chunks: Contiguous slices of the batch, one per task.
+            workers: Number of worker processes.
+            mp_context: Start method context of the workers.
+            kwargs: Additional context passed to rule evaluators.
+
+        Returns:
+            The successfully evaluated Transaction objects, in input order.
+        """
         evaluated: list[Transaction] = []
-        for tx in transactions:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self._config, self.rules, kwargs),
+        ) as executor:
+            for chunk, results in zip(chunks, executor.map(_evaluate_in_worker, chunks)):
+                for tx, result in zip(chunk, results):
+                    if result is not None:
+                        tx.risk_score, tx.triggered_rules = result
+                        evaluated.append(tx)
+        return evaluated
+
+    def evaluate_dataframe(
+        self,
+        df: pd.DataFrame,
+        **kwargs: Any,
+    ) -> list[Transaction]:
+        """Convert and evaluate a whole DataFrame with column arithmetic.
+
+        The batch is held as a TransactionColumns structure-of-arrays and
+        scored in one fused pass by `score_columns`. The resulting
+        Transaction objects carry the same risk_score and triggered_rules
+        as `evaluate_all` would produce. If any rule has no vectorized
+        form, the batch is evaluated row by row instead.
+
+        Args:
+            df: A validated pandas DataFrame with all required columns.
+            **kwargs: Additional context passed to rule evaluators.
+
+        Returns:
+            The list of evaluated Transaction objects, one per valid row.
+        """
+        frame = coerce_dataframe(df)
+        transactions = dataframe_to_transactions(frame, coerce=False)
+        return self._evaluate_columnar(transactions, dataframe_to_columns(frame), **kwargs)
+
+    def evaluate_all_vectorized(
+        self,
+        transactions: list[Transaction],
+        **kwargs: Any,
+    ) -> list[Transaction]:
+        """Evaluate a batch of Transaction objects with column arithmetic.
+
+        The objects' fields are gathered once into a TransactionColumns
+        batch, which is scored like `evaluate_dataframe`. Results match
+        `evaluate_all`; if any rule has no vectorized form, the batch is
+        evaluated row by row instead.
+
+        Args:
+            transactions: List of Transaction objects to evaluate.
+            **kwargs: Additional context passed to rule evaluators.
+
+        Returns:
+            The list of evaluated Transaction objects (with scores populated).
+        """
+        return self._evaluate_columnar(
+            transactions, transactions_to_columns(transactions), **kwargs,
+        )
+
+    def _evaluate_columnar(
+        self,
+        transactions: list[Transaction],
+        columns: TransactionColumns,
+        **kwargs: Any,
+    ) -> list[Transaction]:
+        """Score a columnar batch and write the results onto its objects.
+
+        Args:
+            transactions: The Transaction objects of the batch.
+            columns: The same batch as one NumPy array per field.
+            **kwargs: Additional context passed to rule evaluators.
+
+        Returns:
+            The evaluated Transaction objects.
+        """
+        self.scores = self.trigger_bits = None
+        logger.info(
+            "Starting vectorized evaluation — %d transactions, %d rules",
+            len(transactions),
+            len(self.rules),
+        )
+
+        try:
+            scores, masks = self.score_columns(columns, **kwargs)
+        except NotImplementedError as exc:
+            logger.info("%s — evaluating row by row", exc)
+            return self.evaluate_all(transactions, **kwargs)
+
+        self.scores = scores
+        self.trigger_bits = np.packbits(masks != 0, axis=1, bitorder="little")
+        self._write_results(transactions, scores, masks)
+
+        logger.info("Vectorized evaluation complete — %d transactions processed", len(transactions))
+        return transactions
+
+    def evaluate_and_alert(
+        self,
+        df: pd.DataFrame,
+        **kwargs: Any,
+    ) -> list[Transaction]:
+        """Evaluate a whole DataFrame and return only its fraud alerts.
+
+        The batch is scored column-wise like `evaluate_dataframe`, but
+        Transaction objects are built for the alerting rows alone, so the
+        rows below the alert threshold are never materialized. If any
+        rule has no vectorized form, every row is evaluated row by row
+        and filtered with `get_alerts` instead.
+
+        Args:
+            df: A validated pandas DataFrame with all required columns.
+            **kwargs: Additional context passed to rule evaluators.
+
+        Returns:
+            The evaluated Transaction objects with risk_score >=
+            alert_threshold, in row order.
+        """
+        self.scores = self.trigger_bits = None
+        frame = coerce_dataframe(df)
+        try:
+            scores, masks = self.score_columns(dataframe_to_columns(frame), **kwargs)
+        except NotImplementedError as exc:
+            logger.info("%s — evaluating row by row", exc)
+            transactions = dataframe_to_transactions(frame, coerce=False)
+            return self.get_alerts(self.evaluate_all(transactions, **kwargs))
+
+        hot = self.alert_indices(scores)
+        alerts = dataframe_to_transactions(frame.iloc[hot], coerce=False)
+        self._write_results(alerts, scores[hot], masks[hot])
+        self._log_alert_count(len(alerts), len(frame))
+        return alerts
+
+    def _write_results(
+        self,
+        transactions: list[Transaction],
+        scores: np.ndarray,
+        masks: np.ndarray,
+    ) -> None:
+        """Write columnar scoring results onto their Transaction objects.
+
+        Args:
+            transactions: The Transaction objects, one per row of `masks`.
+            scores: Risk score per transaction.
+            masks: Trigger matrix with one column per registered rule.
+        """
+        for tx, score in zip(transactions, scores.tolist()):
+            tx.risk_score = score
+            tx.triggered_rules = []
+        for j in self._rule_order:
+            rule = self.rules[j]
+            if rule.points <= 0:
+                continue
+            entry = (rule.name, rule.points)
+            for i in np.flatnonzero(masks[:, j]).tolist():
+                transactions[i].triggered_rules.append(entry)
+
+    def score_columns(
+        self,
+        columns: TransactionColumns,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Score a columnar batch against all rules in one fused pass.
+
+        Each rule contributes one column of an (N, rules) int8 trigger
+        matrix; the risk scores are its product with the rules' points
+        vector. In safe mode a rule that raises is logged and left
+        untriggered (fail-safe behavior). When Numba is installed and every
+        registered rule is a built-in one, the whole pass runs in the
+        compiled kernel of `src.engine_numba` instead. With
+        `short_circuit` enabled, triggers past the critical threshold are
+        then dropped as in `evaluate_transaction`.
+
+        Args:
+            columns: The batch as one NumPy array per field.
+            **kwargs: Additional context passed to rule evaluators.
+
+        Returns:
+            A tuple of (risk score per transaction, int8 trigger matrix
+            with one column per registered rule). Scores are int16 when
+            the rules' points always fit, int32 otherwise.
+
+        Raises:
+            NotImplementedError: If a rule has no vectorized form.
+        """
+        scores, masks = self._score_all_rules(columns, **kwargs)
+        if self.short_circuit:
+            return self._stop_at_critical(masks)
+        return scores, masks
+
+    def _score_all_rules(
+        self,
+        columns: TransactionColumns,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Run every rule over the batch, without short-circuiting.
+
+        Args:
+            columns: The batch as one NumPy array per field.
+            **kwargs: Additional context passed to rule evaluators.
+
+        Returns:
+            The same (scores, trigger matrix) pair as `score_columns`.
+        """
+        kinds = self._rule_table["kind"]
+        if (
+            engine_numba.NUMBA_AVAILABLE
+            and (kinds >= 0).all()
+            and len(np.unique(kinds)) == len(kinds)
+        ):
             try:
-                self.evaluate_transaction(tx, **kwargs)
-                evaluated.append(tx)
+                return self._score_columns_jit(columns, **kwargs)
             except Exception as exc:
-                logger.error(
-                    "Unexpected error processing tx %s: %s",
-                    tx.transaction_id,
-                    exc,
-                )
+                if not self.safe_mode:
+                    raise
+                logger.error("Fused kernel failed, using NumPy masks: %s", exc)
+
+        # Fortran order keeps each rule's column contiguous while filling
+        masks = np.zeros((len(columns), len(self.rules)), dtype=np.int8, order="F")
+        for j, rule in enumerate(self.rules):
+            if not rule.vectorized:
+                raise NotImplementedError(f"{rule.name} has no vectorized form")
+            try:
+                masks[:, j] = rule.trigger_mask(columns, **kwargs)
+            except NotImplementedError:
+                raise
+            except Exception as exc:
+                if not self.safe_mode:
+                    raise
+                logger.error("Rule '%s' failed on batch: %s", rule.name, exc)
+
+        return masks @ self._points, masks
+
+    def _stop_at_critical(self, masks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Replay a trigger matrix in evaluation order, stopping at CRITICAL.
+
+        The columnar form of `short_circuit`: a rule only counts for the
+        transactions whose score is still below the critical threshold
+        when the rule's turn comes.
+
+        Args:
+            masks: The int8 trigger matrix of all registered rules.
+
+        Returns:
+            The (scores, trigger matrix) pair with the skipped triggers
+            cleared.
+        """
+        points = self._points
+        scores = np.zeros(len(masks), dtype=points.dtype)
+        kept = np.zeros_like(masks, order="F")
+        for j in self._rule_order:
+            hit = (masks[:, j] != 0) & (scores < self.critical_threshold)
+            kept[:, j] = hit
+            scores += hit * points[j]
+        return scores, kept
+
+    @staticmethod
+    def _points_vector(points: list[int]) -> np.ndarray:
+        """Pack rule points into the narrowest array that holds any score.
+
+        Args:
+            points: Points of each rule (or kernel slot).
+
+        Returns:
+            An int16 array if the sum of all points fits in int16, else
+            int32. Negative points are clamped to 0: rules only ever add
+            to the score, as in evaluate_transaction.
+        """
+        clamped = [max(p, 0) for p in points]
+        dtype = np.int16 if sum(clamped) <= np.iinfo(np.int16).max else np.int32
+        return np.array(clamped, dtype=dtype)
+
+    def _score_columns_jit(
+        self,
+        columns: TransactionColumns,
+        **kwargs: Any,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Run `score_columns` through the fused Numba kernel.
+
+        The kernel's per-slot parameters are scattered from the rule
+        table, whose `kind` column holds each rule's kernel slot.
+
+        Args:
+            columns: The batch as one NumPy array per field.
+            **kwargs: Additional context passed to rule evaluators.
+
+        Returns:
+            The same (scores, trigger matrix) pair as `score_columns`.
+        """
+        slots = self._rule_table["kind"].astype(np.intp)
+        thresholds = np.zeros(engine_numba.N_SLOTS, dtype=np.float64)
+        thresholds[slots] = self._rule_table["th"]
+        points = np.zeros(engine_numba.N_SLOTS, dtype=self._points.dtype)
+        points[slots] = self._points
+        enabled = np.zeros(engine_numba.N_SLOTS, dtype=np.int8)
+        enabled[slots] = 1
+
+        known_device_code = np.full(len(columns.user_ids), -1, dtype=np.int32)
+        new_device = np.flatnonzero(slots == engine_numba.NEW_DEVICE)
+        if new_device.size:
+            rule = self.rules[new_device[0]]
+            known_device_code = rule.known_device_codes(columns, **kwargs)
+
+        scores, masks = engine_numba.score_builtin(
+            columns, thresholds, points, enabled, known_device_code,
+            parallel=len(columns) >= self.parallel_min_batch,
+        )
+        return scores, masks[:, slots]
+
+    def _evaluate_chunk(
+        self,
+        transactions: list[Transaction],
+        **kwargs: Any,
+    ) -> list[Transaction]:
+        """Evaluate a slice of a batch, skipping transactions that fail.
+
+        Outside safe mode, no per-transaction guard is set up and the
+        first failure propagates.
+
+        Args:
+            transactions: List of Transaction objects to evaluate.
+            **kwargs: Additional context passed to rule evaluators.
 
-        logger.info("Batch evaluation complete — %d transactions processed", len(evaluated))
+        Returns:
+            The successfully evaluated Transaction objects.
+        """
+        evaluate = self.evaluate_transaction
+        if not self.safe_mode:
+            return [evaluate(tx, **kwargs) for tx in transactions]
+
+        evaluated: list[Transaction] = []
+        append = evaluated.append
+        for tx in transactions:
+            try:
+                evaluate(tx, **kwargs)
+                append(tx)
+            except Exception as exc:
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        "Unexpected error processing tx %s: %s",
+                        tx.transaction_id,
+                        exc,
+                    )
         return evaluated
 
-    def get_alerts(self, transactions: list[Transaction]) -> list[Transaction]:
+    def get_alerts(
+        self,
+        transactions: list[Transaction],
+        scores: np.ndarray | None = None,
+    ) -> list[Transaction]:
         """Filter evaluated transactions to return only those above the alert threshold.
 
         Args:
             transactions: List of already-evaluated Transaction objects.
+            scores: Optional risk score array aligned with `transactions`
+                (e.g., `self.scores` after `evaluate_dataframe`). When
+                given, alerts are selected with one vectorized comparison.
 
         Returns:
             A list of Transaction objects where risk_score >= alert_threshold.
+
+        Raises:
+            ValueError: If `scores` and `transactions` differ in length.
         """
-        alerts = [tx for tx in transactions if tx.risk_score >= self.alert_threshold]
-        logger.warning(
-            "Generated %d fraud alerts out of %d transactions (%.2f%%)",
-            len(alerts),
-            len(transactions),
-            (len(alerts) / len(transactions) * 100) if transactions else 0,
-        )
+        if scores is not None:
+            if len(scores) != len(transactions):
+                raise ValueError(
+                    f"Got {len(scores)} scores for {len(transactions)} transactions"
+                )
+            alerts = list(map(transactions.__getitem__, self.alert_indices(scores).tolist()))
+        else:
+            threshold = self.alert_threshold
+            alerts = [tx for tx in transactions if tx.risk_score >= threshold]
+        self._log_alert_count(len(alerts), len(transactions))
         return alerts
 
+    @staticmethod
+    def _log_alert_count(alerts: int, total: int) -> None:
+        """Log how many of a batch's transactions raised an alert.
+
+        Args:
+            alerts: Number of alerting transactions.
+            total: Number of transactions in the batch.
+        """
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Generated %d fraud alerts out of %d transactions (%.2f%%)",
+                alerts,
+                total,
+                (alerts / total * 100) if total else 0,
+            )
+
+    def alert_indices(self, scores: np.ndarray) -> np.ndarray:
+        """Return the positions of the scores at or above the alert threshold.
+
+        Args:
+            scores: Risk score per transaction.
+
+        Returns:
+            The sorted indices of the alerting transactions.
+        """
+        return np.flatnonzero(scores >= self.alert_threshold)
+
     def classify_risk_level(self, transaction: Transaction) -> str:
         """Classify a transaction's risk level based on its score.
 
@@ -169,24 +809,125 @@ class FraudEngine:
             return "CRITICAL"
         return "HIGH"
 
+    def classify_all(self, scores: np.ndarray | list[int]) -> np.ndarray:
+        """Classify a whole array of risk scores with one comparison.
+
+        The vectorized form of `classify_risk_level`.
+
+        Args:
+            scores: Risk score per transaction.
+
+        Returns:
+            An object array of 'CRITICAL' / 'HIGH' labels, one per score.
+            The labels are the interned `RISK_LEVELS` strings, so
+            `.tolist()` does not allocate a new string per score.
+        """
+        critical = np.asarray(scores) >= self.critical_threshold
+        return RISK_LEVELS[critical.astype(np.intp)]
+
     def get_rule_statistics(
         self,
         transactions: list[Transaction],
+        trigger_bits: np.ndarray | None = None,
     ) -> dict[str, int]:
         """Compute how many times each rule was triggered across all transactions.
 
         Args:
             transactions: List of evaluated Transaction objects.
+            trigger_bits: Optional packed trigger matrix aligned with
+                `transactions` (e.g., `self.trigger_bits` after
+                `evaluate_dataframe`). When given, the counts are taken
+                from its bits instead of each transaction's triggered_rules.
 
         Returns:
             A dictionary mapping rule names to trigger counts, sorted
             in descending order of frequency.
+
+        Raises:
+            ValueError: If `trigger_bits` and `transactions` differ in length.
         """
-        rule_counts: dict[str, int] = {}
-        for tx in transactions:
-            for rule_entry in tx.triggered_rules:
-                rule_name = rule_entry.split(":")[0]
-                rule_counts[rule_name] = rule_counts.get(rule_name, 0) + 1
+        rule_counts: Counter[str] = Counter()
+        if trigger_bits is None:
+            for tx in transactions:
+                rule_counts.update(name for name, _ in tx.triggered_rules)
+        elif len(trigger_bits) != len(transactions):
+            raise ValueError(
+                f"Got {len(trigger_bits)} trigger rows for {len(transactions)} transactions"
+            )
+        elif len(trigger_bits):
+            hits = np.unpackbits(
+                trigger_bits, axis=1, count=len(self.rules), bitorder="little",
+            )
+            counts = hits.sum(axis=0).tolist()
+            first_row = hits.argmax(axis=0).tolist()
+            # Count rules in the order triggered_rules would first list them
+            seen = sorted(
+                (first_row[j], rank, j)
+                for rank, j in enumerate(self._rule_order)
+                if counts[j] and self.rules[j].points > 0
+            )
+            for _, _, j in seen:
+                rule_counts[self.rules[j].name] += counts[j]
+
+        # most_common() sorts by count descending, ties in first-seen order
+        return dict(rule_counts.most_common())
+
+
+# ── Worker process state ─────────────────────────────────────────────────
+
+def _worker_context() -> multiprocessing.context.BaseContext | None:
+    """Pick a start method for worker processes that never forks this one.
+
+    Forking a parent that may already run Numba's thread pool (fused
+    kernel, dashboard aggregation) deadlocks the workers, so they start
+    from a forkserver where available and are spawned elsewhere (Windows).
+    Both re-import `__main__` in each worker.
+
+    Returns:
+        The multiprocessing context, or None if `__main__` was read from a
+        file that cannot be re-imported (e.g. a script piped to stdin).
+    """
+    main_path = getattr(sys.modules["__main__"], "__file__", None)
+    if main_path is not None and not os.path.isfile(main_path):
+        return None
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+_worker_engine: FraudEngine | None = None
+_worker_kwargs: dict[str, Any] = {}
+
+
+def _init_worker(
+    config: dict[str, Any],
+    rules: list[FraudRule],
+    kwargs: dict[str, Any],
+) -> None:
+    """Build the worker process's engine once, before it takes any task.
 
-        # Sort by count descending
-        return dict(sorted(rule_counts.items(), key=lambda x: x[1], reverse=True))
+    Args:
+        config: The full application configuration dictionary.
+        rules: The registered rules of the parent engine.
+        kwargs: Additional context passed to rule evaluators.
+    """
+    global _worker_engine, _worker_kwargs
+    _worker_engine = FraudEngine(config)
+    _worker_engine.register_rules(rules)
+    _worker_kwargs = kwargs
+
+
+def _evaluate_in_worker(chunk: list[Transaction]) -> list[_WorkerResult]:
+    """Evaluate a chunk in a worker process.
+
+    Args:
+        chunk: The transactions to evaluate (copies of the parent's).
+
+    Returns:
+        One result per transaction, in chunk order.
+    """
+    evaluated = {id(tx) for tx in _worker_engine._evaluate_chunk(chunk, **_worker_kwargs)}
+    return [
+        (tx.risk_score, tx.triggered_rules) if id(tx) in evaluated else None
+        for tx in chunk
+    ]
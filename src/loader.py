@@ -5,23 +5,31 @@ Handles CSV ingestion, schema validation, type coercion,
 and conversion of raw rows into typed Transaction records.
 """
 
+import importlib.util
 import logging
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger("fraud_engine.loader")
 
+# PyArrow is optional; pandas imports it lazily when the engine is used
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
-@dataclass
+
+@dataclass(slots=True)
 class Transaction:
-    """Immutable representation of a single financial transaction.
+    """Representation of a single financial transaction.
 
     All fields map directly to columns in the fraud detection dataset.
     This dataclass enforces type safety and provides a clean interface
-    for rule evaluation.
+    for rule evaluation. Instances use `__slots__` instead of a per-object
+    `__dict__`, which keeps large batches compact. The class is not
+    frozen: the engine writes `risk_score` and `triggered_rules` in place.
     """
 
     transaction_id: str
@@ -46,7 +54,40 @@ class Transaction:
 
     # Populated during engine processing — not part of the raw data
     risk_score: int = field(default=0, init=False)
-    triggered_rules: list[str] = field(default_factory=list, init=False)
+    triggered_rules: list[tuple[str, int]] = field(default_factory=list, init=False)
+
+
+@dataclass
+class TransactionColumns:
+    """Structure-of-arrays view of a batch of transactions.
+
+    Each numeric field is a contiguous NumPy array, so vectorized rules
+    stream only the columns they read instead of whole Transaction
+    objects. Element `i` of every array belongs to the same transaction.
+    User and device IDs are stored as categorical codes (int32) into
+    `user_ids` and `device_ids`, making ID comparisons integer-only.
+    """
+
+    transaction_id: np.ndarray
+    user_code: np.ndarray
+    user_ids: np.ndarray
+    device_code: np.ndarray
+    device_ids: np.ndarray
+    amount: np.ndarray
+    is_fraud: np.ndarray
+    hour: np.ndarray
+    day_of_week: np.ndarray
+    is_weekend: np.ndarray
+    month: np.ndarray
+    is_odd_hour: np.ndarray
+    user_avg_amount: np.ndarray
+    amount_vs_avg_ratio: np.ndarray
+    hours_since_last_tx: np.ndarray
+    location_changed: np.ndarray
+    is_foreign_location: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.transaction_id)
 
 
 # Expected columns in the source CSV
@@ -58,6 +99,29 @@ REQUIRED_COLUMNS: list[str] = [
     "is_foreign_location", "device_id",
 ]
 
+# Required columns grouped by the Transaction field type they map to
+STR_COLUMNS: list[str] = [
+    "transaction_id", "user_id", "timestamp", "merchant",
+    "category", "location", "device_id",
+]
+INT_COLUMNS: list[str] = [
+    "is_fraud", "hour", "day_of_week", "is_weekend", "month",
+    "is_odd_hour", "location_changed", "is_foreign_location",
+]
+FLOAT_COLUMNS: list[str] = [
+    "amount", "user_avg_amount", "amount_vs_avg_ratio", "hours_since_last_tx",
+]
+
+# Narrow parse dtypes for the PyArrow reader. Amounts stay float64 so
+# threshold comparisons and reported values match the default parser.
+ARROW_DTYPES: dict[str, str] = {
+    "transaction_id": "str", "timestamp": "str",
+    "user_id": "category", "merchant": "category",
+    "category": "category", "location": "category", "device_id": "category",
+    **{col: "int8" for col in INT_COLUMNS},
+    **{col: "float64" for col in FLOAT_COLUMNS},
+}
+
 
 def load_dataset(file_path: str) -> pd.DataFrame:
     """Load the CSV dataset and validate its schema.
@@ -77,7 +141,10 @@ def load_dataset(file_path: str) -> pd.DataFrame:
         raise FileNotFoundError(f"Dataset not found: {path.resolve()}")
 
     logger.info("Loading dataset from: %s", path.resolve())
-    df = pd.read_csv(path)
+    if PYARROW_AVAILABLE:
+        df = _read_csv_arrow(path)
+    else:
+        df = pd.read_csv(path)
 
     # Schema validation — ensure all required columns are present
     missing = set(REQUIRED_COLUMNS) - set(df.columns)
@@ -91,52 +158,207 @@ def load_dataset(file_path: str) -> pd.DataFrame:
     return df
 
 
-def dataframe_to_transactions(df: pd.DataFrame) -> list[Transaction]:
-    """Convert a validated DataFrame into a list of Transaction objects.
+def _read_csv_arrow(path: Path) -> pd.DataFrame:
+    """Parse a CSV file with the multithreaded PyArrow reader.
 
-    Each row is converted individually. Rows with missing or corrupt
-    data are logged as warnings and skipped rather than halting execution.
+    String columns are read as text, so IDs and timestamps are reported
+    verbatim instead of being re-rendered from an inferred datetime. Flags
+    are then cast to int8 and repeated string columns to categoricals.
+    Files that do not fit that schema — missing or corrupt values, or
+    missing columns — are re-read with the default parser so that
+    `coerce_dataframe` can skip the bad rows.
 
     Args:
-        df: A validated pandas DataFrame with all required columns.
+        path: Path to the CSV file.
 
     Returns:
-        A list of Transaction dataclass instances.
+        The parsed data as a pandas DataFrame.
     """
-    transactions: list[Transaction] = []
-    skipped = 0
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
 
-    for idx, row in df.iterrows():
-        try:
-            tx = Transaction(
-                transaction_id=str(row["transaction_id"]),
-                user_id=str(row["user_id"]),
-                timestamp=str(row["timestamp"]),
-                amount=float(row["amount"]),
-                merchant=str(row["merchant"]),
-                category=str(row["category"]),
-                location=str(row["location"]),
-                is_fraud=int(row["is_fraud"]),
-                hour=int(row["hour"]),
-                day_of_week=int(row["day_of_week"]),
-                is_weekend=int(row["is_weekend"]),
-                month=int(row["month"]),
-                is_odd_hour=int(row["is_odd_hour"]),
-                user_avg_amount=float(row["user_avg_amount"]),
-                amount_vs_avg_ratio=float(row["amount_vs_avg_ratio"]),
-                hours_since_last_tx=float(row["hours_since_last_tx"]),
-                location_changed=int(row["location_changed"]),
-                is_foreign_location=int(row["is_foreign_location"]),
-                device_id=str(row["device_id"]),
-            )
-            transactions.append(tx)
-        except (ValueError, TypeError, KeyError) as exc:
-            logger.warning("Skipping corrupt row at index %d: %s", idx, exc)
-            skipped += 1
+    options = pa_csv.ConvertOptions(
+        column_types={col: pa.string() for col in STR_COLUMNS},
+        strings_can_be_null=True,  # Empty or "NA" cells are missing, as in pandas
+    )
+    try:
+        table = pa_csv.read_csv(path, convert_options=options)
+        return table.to_pandas().astype(ARROW_DTYPES)
+    except Exception as exc:
+        logger.warning("Typed PyArrow parse failed, using the default parser: %s", exc)
+        return pd.read_csv(path)
+
+
+def coerce_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Coerce the required columns to their Transaction field types.
 
+    Every value is converted as `str()`, `int()` or `float()` would convert
+    it, so a missing string becomes "nan" and a missing float stays NaN.
+    Rows with an integer value that is missing or cannot be converted, or
+    a float value that cannot be parsed, are logged and dropped, so the
+    result can be evaluated column-wise and still line up one-to-one with
+    its Transaction objects.
+
+    Args:
+        df: A validated pandas DataFrame with all required columns.
+
+    Returns:
+        A new DataFrame with typed required columns and a fresh index.
+    """
+    frame = pd.DataFrame({col: df[col].astype(object).map(str) for col in STR_COLUMNS})
+    valid = np.ones(len(df), dtype=bool)
+    for col, convert in [(c, int) for c in INT_COLUMNS] + [(c, float) for c in FLOAT_COLUMNS]:
+        frame[col], col_valid = _coerce_numeric(df[col], convert)
+        valid &= col_valid
+
+    skipped = int((~valid).sum())
+    for idx in df.index[~valid]:
+        logger.warning("Skipping corrupt row at index %s: missing or non-numeric value", idx)
     if skipped > 0:
         logger.warning("Total rows skipped due to data issues: %d", skipped)
 
+    frame = frame[valid].reset_index(drop=True)
+    frame[INT_COLUMNS] = frame[INT_COLUMNS].astype(np.int64)
+    frame[FLOAT_COLUMNS] = frame[FLOAT_COLUMNS].astype(np.float64)
+    return frame[REQUIRED_COLUMNS]
+
+
+def _coerce_numeric(values: pd.Series, convert: type) -> tuple[np.ndarray, np.ndarray]:
+    """Convert one column with `int` or `float`, flagging failed values.
+
+    Numeric columns are converted as a whole: `int()` rejects only NaN and
+    infinities there, and truncates like `astype(np.int64)`. Text columns
+    (a corrupt value turned the whole column into strings) fall back to
+    calling `convert` per value, so "5.7" or "abc" is rejected exactly as
+    the per-row conversion would reject it.
+
+    Args:
+        values: The raw column.
+        convert: `int` or `float`.
+
+    Returns:
+        A tuple of (float64 values, bool mask of convertible values).
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        numeric = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        if convert is int:
+            return numeric, np.isfinite(numeric)
+        return numeric, np.ones(len(numeric), dtype=bool)
+
+    numeric = np.full(len(values), np.nan)
+    valid = np.zeros(len(values), dtype=bool)
+    for i, value in enumerate(values.tolist()):
+        try:
+            numeric[i] = convert(value)
+            valid[i] = True
+        except (ValueError, TypeError, OverflowError):
+            pass
+    return numeric, valid
+
+
+def dataframe_to_columns(df: pd.DataFrame) -> TransactionColumns:
+    """Build a columnar batch from a coerced DataFrame.
+
+    Args:
+        df: A DataFrame returned by `coerce_dataframe`.
+
+    Returns:
+        A TransactionColumns with float64 amounts and ratios, int8 flags
+        and hours, and int32 categorical codes for users and devices.
+    """
+    users = pd.Categorical(df["user_id"])
+    devices = pd.Categorical(df["device_id"])
+    return TransactionColumns(
+        transaction_id=df["transaction_id"].to_numpy(dtype=object),
+        user_code=users.codes.astype(np.int32),
+        user_ids=users.categories.to_numpy(dtype=object),
+        device_code=devices.codes.astype(np.int32),
+        device_ids=devices.categories.to_numpy(dtype=object),
+        **{col: df[col].to_numpy(dtype=np.int8) for col in INT_COLUMNS},
+        **{col: df[col].to_numpy(dtype=np.float64) for col in FLOAT_COLUMNS},
+    )
+
+
+def known_device_codes(
+    columns: TransactionColumns,
+    user_device_map: dict[str, str],
+) -> np.ndarray:
+    """Encode each user's known device as a code into `columns.device_ids`.
+
+    The lookup runs once per distinct user with pandas hash joins, so
+    comparing a batch against known devices is a gather plus an integer
+    comparison: `known[columns.user_code] != columns.device_code`.
+
+    Args:
+        columns: A columnar batch from `dataframe_to_columns`.
+        user_device_map: Mapping of user_id → most frequent device_id.
+
+    Returns:
+        An int32 array indexed by user code: the known device's code,
+        -1 if the user has no known device, or -2 if the known device
+        never appears in this batch.
+    """
+    known = pd.Series(columns.user_ids, dtype=object).map(user_device_map)
+    codes = pd.Index(columns.device_ids).get_indexer(known).astype(np.int32)
+    codes[(codes == -1) & known.notna().to_numpy()] = -2
+    return codes
+
+
+def transactions_to_columns(transactions: list[Transaction]) -> TransactionColumns:
+    """Build a columnar batch from Transaction objects.
+
+    Each numeric field is gathered once into a typed array, with the
+    same dtypes as `dataframe_to_columns`.
+
+    Args:
+        transactions: The Transaction objects of the batch.
+
+    Returns:
+        A TransactionColumns aligned with `transactions`.
+    """
+    n = len(transactions)
+
+    def column(name: str, dtype: type) -> np.ndarray:
+        return np.fromiter(map(attrgetter(name), transactions), dtype=dtype, count=n)
+
+    users = pd.Categorical([tx.user_id for tx in transactions])
+    devices = pd.Categorical([tx.device_id for tx in transactions])
+    return TransactionColumns(
+        transaction_id=np.array([tx.transaction_id for tx in transactions], dtype=object),
+        user_code=users.codes.astype(np.int32),
+        user_ids=users.categories.to_numpy(dtype=object),
+        device_code=devices.codes.astype(np.int32),
+        device_ids=devices.categories.to_numpy(dtype=object),
+        **{col: column(col, np.int8) for col in INT_COLUMNS},
+        **{col: column(col, np.float64) for col in FLOAT_COLUMNS},
+    )
+
+
+def dataframe_to_transactions(
+    df: pd.DataFrame,
+    coerce: bool = True,
+) -> list[Transaction]:
+    """Convert a validated DataFrame into a list of Transaction objects.
+
+    Columns are type-coerced once up front (see `coerce_dataframe`), so
+    rows with missing or corrupt data are logged and skipped rather than
+    halting execution. The records are then built from zipped column
+    lists, avoiding a per-row Series allocation.
+
+    Args:
+        df: A validated pandas DataFrame with all required columns.
+        coerce: Whether `df` still needs coercing. Pass False for a frame
+            already returned by `coerce_dataframe`.
+
+    Returns:
+        A list of Transaction dataclass instances.
+    """
+    frame = coerce_dataframe(df) if coerce else df
+
+    # REQUIRED_COLUMNS lists the columns in Transaction field order
+    columns = [frame[col].to_numpy().tolist() for col in REQUIRED_COLUMNS]
+    transactions = [Transaction(*values) for values in zip(*columns)]
+
     logger.info("Converted %d rows into Transaction objects", len(transactions))
     return transactions
 
@@ -153,13 +375,18 @@ def compute_user_device_map(df: pd.DataFrame) -> dict[str, str]:
     Returns:
         A dictionary mapping user_id → most frequent device_id.
     """
-    device_map: dict[str, str] = {}
-    grouped = df.groupby("user_id")["device_id"]
-
-    for user_id, devices in grouped:
-        most_common = devices.mode()
-        if len(most_common) > 0:
-            device_map[str(user_id)] = str(most_common.iloc[0])
+    # Count each (user, device) pair, then keep each user's top pair. The
+    # pairs come out sorted and the sort is stable, so ties resolve to the
+    # smallest device_id — the same choice as Series.mode().
+    counts = (
+        df.groupby(["user_id", "device_id"], observed=True).size()
+        .sort_values(ascending=False, kind="stable")
+        .reset_index()
+        .drop_duplicates("user_id")
+    )
+    device_map: dict[str, str] = dict(
+        zip(counts["user_id"].astype(str), counts["device_id"].astype(str))
+    )
 
     logger.info(
         "Built user-device map for %d users", len(device_map),
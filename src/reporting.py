@@ -10,6 +10,8 @@ import json
 import logging
 import sys
 from datetime import datetime, timezone
+from heapq import nlargest
+from operator import attrgetter
 from typing import Any
 
 from rich.console import Console
@@ -17,8 +19,14 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+try:
+    import orjson
+except ImportError:  # Optional dependency — fall back to the stdlib encoder
+    orjson = None
+
 from src.engine import FraudEngine
 from src.loader import Transaction
+from src.utils import format_rule_labels
 
 logger = logging.getLogger("fraud_engine.reporting")
 
@@ -26,6 +34,9 @@ logger = logging.getLogger("fraud_engine.reporting")
 _utf8_stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
 console = Console(file=_utf8_stdout, force_terminal=True)
 
+# Rich style of each risk level in the alerts table
+_LEVEL_STYLES: dict[str, str] = {"CRITICAL": "bold red", "HIGH": "bold yellow"}
+
 
 def generate_json_report(
     engine: FraudEngine,
@@ -36,7 +47,8 @@ def generate_json_report(
     """Generate a structured JSON report of all fraud alerts.
 
     The report includes metadata (timestamp, totals, fraud rate)
-    and a detailed list of each alerted transaction.
+    and a detailed list of each alerted transaction. It is serialized
+    with orjson when installed, otherwise with the stdlib encoder.
 
     Args:
         engine: The FraudEngine instance (used for risk classification).
@@ -51,32 +63,36 @@ def generate_json_report(
     total_alerts = len(alerts)
     fraud_rate = (total_alerts / total_processed * 100) if total_processed > 0 else 0.0
 
+    # Sorted by risk_score descending for readability
+    ranked = sorted(alerts, key=attrgetter("risk_score"), reverse=True)
+    levels = engine.classify_all([tx.risk_score for tx in ranked]).tolist()
+
     report: dict[str, Any] = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "total_processed": total_processed,
         "total_alerts": total_alerts,
         "fraud_rate_pct": round(fraud_rate, 2),
-        "alerts": [],
+        "alerts": [
+            {
+                "transaction_id": tx.transaction_id,
+                "user_id": tx.user_id,
+                "timestamp": tx.timestamp,
+                "amount": tx.amount,
+                "risk_score": tx.risk_score,
+                "triggered_rules": format_rule_labels(tx.triggered_rules),
+                "risk_level": level,
+            }
+            for tx, level in zip(ranked, levels)
+        ],
     }
 
-    for tx in alerts:
-        alert_entry = {
-            "transaction_id": tx.transaction_id,
-            "user_id": tx.user_id,
-            "timestamp": tx.timestamp,
-            "amount": tx.amount,
-            "risk_score": tx.risk_score,
-            "triggered_rules": tx.triggered_rules,
-            "risk_level": engine.classify_risk_level(tx),
-        }
-        report["alerts"].append(alert_entry)
-
-    # Sort alerts by risk_score descending for readability
-    report["alerts"].sort(key=lambda x: x["risk_score"], reverse=True)
-
     # Write to file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
 
     logger.info("JSON report written to: %s", output_path)
     return report
@@ -119,10 +135,11 @@ def print_console_report(
         f"  [bold cyan]Most Active Rule[/bold cyan]  :  [bold magenta]{most_active_rule}[/bold magenta]",
     ]
 
-    # Risk distribution
-    critical_count = sum(
-        1 for tx in alerts if engine.classify_risk_level(tx) == "CRITICAL"
-    )
+    # Risk distribution — alerts are classified in one vectorized call and
+    # the levels are reused by position in the top-10 table below
+    alert_scores = list(map(attrgetter("risk_score"), alerts))
+    levels = engine.classify_all(alert_scores).tolist()
+    critical_count = levels.count("CRITICAL")
     high_count = total_alerts - critical_count
     summary_lines.append("")
     summary_lines.append(
@@ -178,21 +195,22 @@ def print_console_report(
         alert_table.add_column("Level", justify="center")
         alert_table.add_column("Rules Triggered", style="dim", max_width=40)
 
-        sorted_alerts = sorted(alerts, key=lambda x: x.risk_score, reverse=True)[:10]
-        for tx in sorted_alerts:
-            risk_level = engine.classify_risk_level(tx)
-            level_style = "bold red" if risk_level == "CRITICAL" else "bold yellow"
-            level_text = Text(risk_level, style=level_style)
-            rules_str = ", ".join(tx.triggered_rules)
-
-            alert_table.add_row(
+        # Top 10 by score, ranked by position so the cached levels are
+        # reused; every cell is formatted up front
+        top_idx = nlargest(10, range(total_alerts), key=alert_scores.__getitem__)
+        rows = [
+            (
                 tx.transaction_id[:16] + "…",
                 tx.user_id,
                 f"${tx.amount:,.2f}",
                 str(tx.risk_score),
-                level_text,
-                rules_str,
+                Text(levels[i], style=_LEVEL_STYLES.get(levels[i], "bold yellow")),
+                ", ".join(format_rule_labels(tx.triggered_rules)),
             )
+            for i, tx in zip(top_idx, map(alerts.__getitem__, top_idx))
+        ]
+        for row in rows:
+            alert_table.add_row(*row)
 
         console.print(alert_table)
 
@@ -8,12 +8,21 @@ class and provide an `evaluate()` method that returns a risk score.
 Adding a new rule requires ONLY:
   1. Creating a new class that inherits from FraudRule
   2. Registering it in the engine — no modification to existing code.
+
+Rules may also implement `trigger_mask()`, the vectorized form of
+`evaluate()` over whole NumPy columns, which the engine fuses into a
+single scoring pass for DataFrames.
 """
 
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
-from src.loader import Transaction
+import numpy as np
+
+from src import engine_numba
+from src.loader import Transaction, TransactionColumns, known_device_codes
 
 
 class FraudRule(ABC):
@@ -22,11 +31,28 @@ class FraudRule(ABC):
     Each concrete rule encapsulates a single business condition
     and returns a point score if the condition is triggered.
 
+    Configuration is read once here and in subclass constructors, so
+    `evaluate()` only touches plain typed attributes.
+
     Attributes:
-        name: Human-readable name of the rule (auto-derived from class name).
+        name: Human-readable name of the rule (auto-derived from class name,
+            interned so every triggered_rules entry shares one string).
         config: Rule-specific configuration parameters from config.yaml.
+        points: Score awarded when the rule triggers.
     """
 
+    # Points awarded when the config section does not set `points`
+    default_points: int = 0
+
+    # Slot of this rule in the fused Numba kernel (None: not supported).
+    # Only used while the rule keeps the slot owner's evaluate().
+    kernel_slot: int | None = None
+
+    # Condition of evaluate() as a Python expression over `tx`, with `{th}`
+    # standing for `kernel_threshold`, inlined by the engine into one
+    # generated per-row scorer. Used under the same terms as kernel_slot.
+    row_condition: str | None = None
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the rule with its configuration section.
 
@@ -34,7 +60,8 @@ class FraudRule(ABC):
             config: Dictionary with rule-specific thresholds and parameters.
         """
         self.config = config
-        self.name: str = self.__class__.__name__
+        self.name: str = sys.intern(self.__class__.__name__)
+        self.points: int = int(config.get("points", self.default_points))
 
     @abstractmethod
     def evaluate(self, transaction: Transaction, **kwargs: Any) -> int:
@@ -49,6 +76,81 @@ class FraudRule(ABC):
         """
         ...
 
+    def trigger_mask(self, columns: TransactionColumns, **kwargs: Any) -> np.ndarray:
+        """Evaluate a whole batch of transactions at once.
+
+        The vectorized counterpart of `evaluate()`: element `i` of the
+        result is True exactly when `evaluate()` on row `i` returns
+        `self.points`. Rules that do not override this are evaluated row
+        by row by the engine instead.
+
+        Args:
+            columns: The batch as one NumPy array per field.
+            **kwargs: Additional context (e.g., user_device_map).
+
+        Returns:
+            A boolean array marking the transactions that trigger the rule.
+
+        Raises:
+            NotImplementedError: If the rule has no vectorized form.
+        """
+        raise NotImplementedError(f"{self.name} has no vectorized form")
+
+    def build_fast_eval(self) -> Callable[..., int]:
+        """Build the per-row scorer the engine calls in place of `evaluate()`.
+
+        Rules override this with a closure over their configuration, so
+        the row-by-row loop reads local variables instead of instance
+        attributes. The default is the bound `evaluate()` itself.
+
+        Returns:
+            A callable taking (transaction, **kwargs) and returning the
+            same score as `evaluate()`.
+        """
+        return self.evaluate
+
+    @property
+    def fast_eval(self) -> Callable[..., int]:
+        """`build_fast_eval()`, or `evaluate` if a subclass overrides `evaluate()`."""
+        if not self._defined_with_evaluate("build_fast_eval"):
+            return self.evaluate
+        return self.build_fast_eval()
+
+    @property
+    def kernel_threshold(self) -> float:
+        """Threshold passed to the fused kernel for this rule's slot."""
+        return 0.0
+
+    @property
+    def vectorized(self) -> bool:
+        """Whether `trigger_mask()` is the batch form of this rule's `evaluate()`.
+
+        False when a subclass overrides `evaluate()` but inherits
+        `trigger_mask()`, which would then score a different condition.
+        """
+        return self._defined_with_evaluate("trigger_mask")
+
+    @property
+    def fused_slot(self) -> int | None:
+        """`kernel_slot`, or None if a subclass overrides the slot's `evaluate()`."""
+        if self.kernel_slot is None or not self._defined_with_evaluate("kernel_slot"):
+            return None
+        return self.kernel_slot
+
+    def _defined_with_evaluate(self, attr: str) -> bool:
+        """Check that `attr` comes from the class defining `evaluate()`.
+
+        Args:
+            attr: Name of a class attribute of this rule.
+
+        Returns:
+            True if the class that defines `attr` also defines the
+            `evaluate()` this rule runs.
+        """
+        cls = type(self)
+        owner = next(c for c in cls.__mro__ if attr in vars(c))
+        return vars(owner).get("evaluate") is cls.evaluate
+
     def __repr__(self) -> str:
         return f"<{self.name}>"
 
@@ -60,6 +162,20 @@ class HighAmountRule(FraudRule):
     threshold (default: $15,000).
     """
 
+    default_points = 50
+    kernel_slot = engine_numba.HIGH_AMOUNT
+    row_condition = "tx.amount > {th}"
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Read the amount threshold from the rule config."""
+        super().__init__(config)
+        self.threshold: float = float(config.get("threshold", 15000))
+
+    @property
+    def kernel_threshold(self) -> float:
+        """Amount threshold for the kernel's HIGH_AMOUNT slot."""
+        return self.threshold
+
     def evaluate(self, transaction: Transaction, **kwargs: Any) -> int:
         """Check if amount exceeds the high-amount threshold.
 
@@ -69,12 +185,23 @@ class HighAmountRule(FraudRule):
         Returns:
             Configured points if triggered, 0 otherwise.
         """
-        threshold = self.config.get("threshold", 15000)
-        points = self.config.get("points", 50)
-        if transaction.amount > threshold:
-            return points
+        if transaction.amount > self.threshold:
+            return self.points
         return 0
 
+    def build_fast_eval(self) -> Callable[..., int]:
+        """Closure form of `evaluate()` over the threshold and points."""
+        threshold, points = self.threshold, self.points
+
+        def evaluate(transaction: Transaction, **kwargs: Any) -> int:
+            return points if transaction.amount > threshold else 0
+
+        return evaluate
+
+    def trigger_mask(self, columns: TransactionColumns, **kwargs: Any) -> np.ndarray:
+        """Vectorized form of `evaluate()` over the `amount` column."""
+        return columns.amount > self.threshold
+
 
 class OddHoursRule(FraudRule):
     """Flags transactions occurring during unusual hours.
@@ -83,6 +210,10 @@ class OddHoursRule(FraudRule):
     (typically between 22:00 and 05:00).
     """
 
+    default_points = 30
+    kernel_slot = engine_numba.ODD_HOURS
+    row_condition = "tx.is_odd_hour == 1"
+
     def evaluate(self, transaction: Transaction, **kwargs: Any) -> int:
         """Check if the transaction occurred during odd hours.
 
@@ -92,11 +223,23 @@ class OddHoursRule(FraudRule):
         Returns:
             Configured points if triggered, 0 otherwise.
         """
-        points = self.config.get("points", 30)
         if transaction.is_odd_hour == 1:
-            return points
+            return self.points
         return 0
 
+    def build_fast_eval(self) -> Callable[..., int]:
+        """Closure form of `evaluate()` over the points."""
+        points = self.points
+
+        def evaluate(transaction: Transaction, **kwargs: Any) -> int:
+            return points if transaction.is_odd_hour == 1 else 0
+
+        return evaluate
+
+    def trigger_mask(self, columns: TransactionColumns, **kwargs: Any) -> np.ndarray:
+        """Vectorized form of `evaluate()` over the `is_odd_hour` column."""
+        return columns.is_odd_hour == 1
+
 
 class VelocityRule(FraudRule):
     """Flags rapid-fire transactions from the same user.
@@ -105,6 +248,20 @@ class VelocityRule(FraudRule):
     is below the configured minimum (default: 0.17 hours ≈ 10 min).
     """
 
+    default_points = 40
+    kernel_slot = engine_numba.VELOCITY
+    row_condition = "tx.hours_since_last_tx < {th}"
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Read the minimum gap between transactions from the rule config."""
+        super().__init__(config)
+        self.min_hours: float = float(config.get("min_hours", 0.17))
+
+    @property
+    def kernel_threshold(self) -> float:
+        """Minimum gap in hours for the kernel's VELOCITY slot."""
+        return self.min_hours
+
     def evaluate(self, transaction: Transaction, **kwargs: Any) -> int:
         """Check if transactions are occurring too rapidly.
 
@@ -114,12 +271,23 @@ class VelocityRule(FraudRule):
         Returns:
             Configured points if triggered, 0 otherwise.
         """
-        min_hours = self.config.get("min_hours", 0.17)
-        points = self.config.get("points", 40)
-        if transaction.hours_since_last_tx < min_hours:
-            return points
+        if transaction.hours_since_last_tx < self.min_hours:
+            return self.points
         return 0
 
+    def build_fast_eval(self) -> Callable[..., int]:
+        """Closure form of `evaluate()` over the minimum gap and points."""
+        min_hours, points = self.min_hours, self.points
+
+        def evaluate(transaction: Transaction, **kwargs: Any) -> int:
+            return points if transaction.hours_since_last_tx < min_hours else 0
+
+        return evaluate
+
+    def trigger_mask(self, columns: TransactionColumns, **kwargs: Any) -> np.ndarray:
+        """Vectorized form of `evaluate()` over `hours_since_last_tx`."""
+        return columns.hours_since_last_tx < self.min_hours
+
 
 class UnusualAmountRule(FraudRule):
     """Flags transactions significantly higher than the user's average.
@@ -128,6 +296,20 @@ class UnusualAmountRule(FraudRule):
     threshold (default: 3.0x the user's average).
     """
 
+    default_points = 35
+    kernel_slot = engine_numba.UNUSUAL_AMOUNT
+    row_condition = "tx.amount_vs_avg_ratio > {th}"
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Read the amount-to-average ratio threshold from the rule config."""
+        super().__init__(config)
+        self.ratio_threshold: float = float(config.get("ratio_threshold", 3.0))
+
+    @property
+    def kernel_threshold(self) -> float:
+        """Ratio threshold for the kernel's UNUSUAL_AMOUNT slot."""
+        return self.ratio_threshold
+
     def evaluate(self, transaction: Transaction, **kwargs: Any) -> int:
         """Check if the amount deviates significantly from user average.
 
@@ -137,12 +319,23 @@ class UnusualAmountRule(FraudRule):
         Returns:
             Configured points if triggered, 0 otherwise.
         """
-        ratio_threshold = self.config.get("ratio_threshold", 3.0)
-        points = self.config.get("points", 35)
-        if transaction.amount_vs_avg_ratio > ratio_threshold:
-            return points
+        if transaction.amount_vs_avg_ratio > self.ratio_threshold:
+            return self.points
         return 0
 
+    def build_fast_eval(self) -> Callable[..., int]:
+        """Closure form of `evaluate()` over the ratio threshold and points."""
+        ratio_threshold, points = self.ratio_threshold, self.points
+
+        def evaluate(transaction: Transaction, **kwargs: Any) -> int:
+            return points if transaction.amount_vs_avg_ratio > ratio_threshold else 0
+
+        return evaluate
+
+    def trigger_mask(self, columns: TransactionColumns, **kwargs: Any) -> np.ndarray:
+        """Vectorized form of `evaluate()` over `amount_vs_avg_ratio`."""
+        return columns.amount_vs_avg_ratio > self.ratio_threshold
+
 
 class LocationChangeRule(FraudRule):
     """Flags transactions with a location change within a short window.
@@ -152,6 +345,20 @@ class LocationChangeRule(FraudRule):
       - hours_since_last_tx < max_hours (default: 2.0)
     """
 
+    default_points = 30
+    kernel_slot = engine_numba.LOCATION_CHANGE
+    row_condition = "tx.location_changed == 1 and tx.hours_since_last_tx < {th}"
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Read the location-change window from the rule config."""
+        super().__init__(config)
+        self.max_hours: float = float(config.get("max_hours", 2.0))
+
+    @property
+    def kernel_threshold(self) -> float:
+        """Time window in hours for the kernel's LOCATION_CHANGE slot."""
+        return self.max_hours
+
     def evaluate(self, transaction: Transaction, **kwargs: Any) -> int:
         """Check for suspicious location changes in a short timeframe.
 
@@ -161,15 +368,30 @@ class LocationChangeRule(FraudRule):
         Returns:
             Configured points if triggered, 0 otherwise.
         """
-        max_hours = self.config.get("max_hours", 2.0)
-        points = self.config.get("points", 30)
         if (
             transaction.location_changed == 1
-            and transaction.hours_since_last_tx < max_hours
+            and transaction.hours_since_last_tx < self.max_hours
         ):
-            return points
+            return self.points
         return 0
 
+    def build_fast_eval(self) -> Callable[..., int]:
+        """Closure form of `evaluate()` over the time window and points."""
+        max_hours, points = self.max_hours, self.points
+
+        def evaluate(transaction: Transaction, **kwargs: Any) -> int:
+            if transaction.location_changed == 1 and transaction.hours_since_last_tx < max_hours:
+                return points
+            return 0
+
+        return evaluate
+
+    def trigger_mask(self, columns: TransactionColumns, **kwargs: Any) -> np.ndarray:
+        """Vectorized form of `evaluate()` over the location columns."""
+        return (columns.location_changed == 1) & (
+            columns.hours_since_last_tx < self.max_hours
+        )
+
 
 class ForeignTxRule(FraudRule):
     """Flags transactions originating from a foreign location.
@@ -177,6 +399,10 @@ class ForeignTxRule(FraudRule):
     Triggers when `is_foreign_location` is set to 1.
     """
 
+    default_points = 25
+    kernel_slot = engine_numba.FOREIGN_TX
+    row_condition = "tx.is_foreign_location == 1"
+
     def evaluate(self, transaction: Transaction, **kwargs: Any) -> int:
         """Check if the transaction is from a foreign location.
 
@@ -186,11 +412,23 @@ class ForeignTxRule(FraudRule):
         Returns:
             Configured points if triggered, 0 otherwise.
         """
-        points = self.config.get("points", 25)
         if transaction.is_foreign_location == 1:
-            return points
+            return self.points
         return 0
 
+    def build_fast_eval(self) -> Callable[..., int]:
+        """Closure form of `evaluate()` over the points."""
+        points = self.points
+
+        def evaluate(transaction: Transaction, **kwargs: Any) -> int:
+            return points if transaction.is_foreign_location == 1 else 0
+
+        return evaluate
+
+    def trigger_mask(self, columns: TransactionColumns, **kwargs: Any) -> np.ndarray:
+        """Vectorized form of `evaluate()` over `is_foreign_location`."""
+        return columns.is_foreign_location == 1
+
 
 class NewDeviceRule(FraudRule):
     """Flags transactions from a device not typically used by the user.
@@ -199,6 +437,13 @@ class NewDeviceRule(FraudRule):
     frequently used device (pre-computed from the dataset).
     """
 
+    default_points = 20
+    kernel_slot = engine_numba.NEW_DEVICE
+    row_condition = (
+        "(known := user_device_map.get(tx.user_id)) is not None"
+        " and tx.device_id != known"
+    )
+
     def evaluate(self, transaction: Transaction, **kwargs: Any) -> int:
         """Check if the transaction is from an unfamiliar device.
 
@@ -210,7 +455,6 @@ class NewDeviceRule(FraudRule):
         Returns:
             Configured points if triggered, 0 otherwise.
         """
-        points = self.config.get("points", 20)
         user_device_map: dict[str, str] = kwargs.get("user_device_map", {})
 
         known_device = user_device_map.get(transaction.user_id)
@@ -219,5 +463,47 @@ class NewDeviceRule(FraudRule):
             return 0
 
         if transaction.device_id != known_device:
-            return points
+            return self.points
         return 0
+
+    def build_fast_eval(self) -> Callable[..., int]:
+        """Closure form of `evaluate()` over the points."""
+        points = self.points
+
+        def evaluate(transaction: Transaction, **kwargs: Any) -> int:
+            known_device = kwargs.get("user_device_map", {}).get(transaction.user_id)
+            if known_device is None or transaction.device_id == known_device:
+                return 0
+            return points
+
+        return evaluate
+
+    def trigger_mask(self, columns: TransactionColumns, **kwargs: Any) -> np.ndarray:
+        """Vectorized form of `evaluate()` over the user and device codes.
+
+        Each user's known device is resolved once to a device code, so the
+        per-row check is an integer comparison. Users missing from
+        `user_device_map`, and missing user IDs (code -1), never trigger,
+        as in `evaluate()`.
+        """
+        known_code = np.where(
+            columns.user_code >= 0,
+            self.known_device_codes(columns, **kwargs)[columns.user_code],
+            -1,
+        )
+        return (known_code != -1) & (known_code != columns.device_code)
+
+    def known_device_codes(self, columns: TransactionColumns, **kwargs: Any) -> np.ndarray:
+        """Resolve each user category's known device to a device code.
+
+        Args:
+            columns: The batch as one NumPy array per field.
+            **kwargs: Must include 'user_device_map'.
+
+        Returns:
+            An int32 array indexed by user code: the known device's code,
+            -1 if the user has no known device, or -2 if the known device
+            never appears in this batch.
+        """
+        user_device_map: dict[str, str] = kwargs.get("user_device_map", {})
+        return known_device_codes(columns, user_device_map)
@@ -12,10 +12,18 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml — use the pure-Python loader
+    from yaml import SafeLoader as _YamlLoader
+
 
 def load_config(config_path: str = "config.yaml") -> dict[str, Any]:
     """Load and validate the YAML configuration file.
 
+    Parsing uses the libyaml-backed CSafeLoader when PyYAML was built
+    with it.
+
     Args:
         config_path: Path to the YAML configuration file.
             Defaults to 'config.yaml' in the current working directory.
@@ -32,7 +40,7 @@ def load_config(config_path: str = "config.yaml") -> dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {path.resolve()}")
 
     with open(path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
 
     _validate_config(config)
     return config
@@ -120,3 +128,15 @@ def format_percentage(value: float) -> str:
         A formatted percentage string.
     """
     return f"{value:.2f}%"
+
+
+def format_rule_labels(triggered_rules: list[tuple[str, int]]) -> list[str]:
+    """Format a transaction's triggered rules for display.
+
+    Args:
+        triggered_rules: (rule name, score) pairs as stored by the engine.
+
+    Returns:
+        One label per rule, like 'HighAmountRule: +50'.
+    """
+    return [f"{name}: +{score}" for name, score in triggered_rules]
@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration.
+
+Makes the project root importable, so test modules can import the
+`src` package without each adjusting `sys.path`.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
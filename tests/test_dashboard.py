@@ -0,0 +1,162 @@
+"""
+Tests for the HTML dashboard generator.
+
+Tests the computed chart data, the no-alerts page, the regeneration
+cache and the gzip-precompressed copy.
+"""
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+from src import dashboard
+from src.dashboard import _compute_dashboard_data, generate_dashboard
+from src.engine import FraudEngine
+from src.loader import Transaction
+from src.rules import HighAmountRule, OddHoursRule
+
+SAMPLE_CONFIG: dict = {
+    "rules": {
+        "high_amount": {"threshold": 15000, "points": 50},
+        "odd_hours": {"points": 30},
+    },
+    "alerting": {"risk_score_threshold": 75, "critical_threshold": 120},
+}
+
+
+def _make_transaction(**overrides) -> Transaction:
+    """Factory helper for creating Transaction fixtures."""
+    defaults = {
+        "transaction_id": "tx-dashboard-001",
+        "user_id": "user-001",
+        "timestamp": "2023-06-01 12:00:00",
+        "amount": 500.0,
+        "merchant": "TestMerchant",
+        "category": "Services",
+        "location": "CDMX",
+        "is_fraud": 0,
+        "hour": 12,
+        "day_of_week": 3,
+        "is_weekend": 0,
+        "month": 6,
+        "is_odd_hour": 0,
+        "user_avg_amount": 1000.0,
+        "amount_vs_avg_ratio": 0.5,
+        "hours_since_last_tx": 24.0,
+        "location_changed": 0,
+        "is_foreign_location": 0,
+        "device_id": "device-main",
+    }
+    defaults.update(overrides)
+    return Transaction(**defaults)
+
+
+def _evaluated_batch() -> tuple[FraudEngine, list[Transaction], list[Transaction]]:
+    """Evaluate a small batch with two alerts and return (engine, batch, alerts)."""
+    engine = FraudEngine(SAMPLE_CONFIG)
+    engine.register_rules([
+        HighAmountRule(SAMPLE_CONFIG["rules"]["high_amount"]),
+        OddHoursRule(SAMPLE_CONFIG["rules"]["odd_hours"]),
+    ])
+    transactions = [
+        _make_transaction(transaction_id="tx-alert-1", amount=20000.0, is_odd_hour=1, hour=23),
+        _make_transaction(transaction_id="tx-alert-2", amount=40000.0, is_odd_hour=1, hour=2,
+                          is_weekend=1),
+        _make_transaction(transaction_id="tx-clean-1", hour=10),
+        _make_transaction(transaction_id="tx-clean-2", amount=16000.0, hour=11),
+    ]
+    engine.evaluate_all(transactions)
+    return engine, transactions, engine.get_alerts(transactions)
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Dashboard Data Tests
+# ────────────────────────────────────────────────────────────────────────────
+
+class TestDashboardData:
+    """Tests for the metrics and breakdowns behind the charts."""
+
+    def test_alert_breakdowns_use_the_given_alerts(self) -> None:
+        """Every alert chart describes the alert list passed in, not a threshold."""
+        engine, transactions, alerts = _evaluated_batch()
+        data = _compute_dashboard_data(engine, transactions, alerts[:1])
+
+        assert data["summary"]["alerts"] == 1
+        assert sum(data["amount_ranges"].values()) == 1
+        assert sum(data["alerts_by_hour"].values()) == 1
+        assert data["alerts_by_hour"][23] == 1
+        assert data["weekend_vs_weekday"] == {"Fin de semana": 0, "Entre semana": 1}
+        assert sum(data["legit_by_hour"].values()) == 3
+
+
+    def test_batch_without_alerts_gets_summary_only_page(self, tmp_path: Path) -> None:
+        """No alerts: summary metrics only, and a page without charts."""
+        engine, transactions, _ = _evaluated_batch()
+        clean = transactions[2:]
+        output = tmp_path / "dashboard.html"
+
+        data = _compute_dashboard_data(engine, clean, [])
+        generate_dashboard(engine, clean, [], str(output), precompress=False)
+
+        assert set(data) == {"generated_at", "summary"}
+        assert data["summary"] == {
+            "total": 2, "alerts": 0, "fraud_rate": 0.0, "avg_score": 25.0,
+            "max_score": 50, "critical": 0, "high": 0, "no_alert": 2,
+        }
+        page = output.read_text(encoding="utf-8")
+        assert "Sin Alertas de Fraude" in page
+        assert "chart.js" not in page.lower()
+
+# ────────────────────────────────────────────────────────────────────────────
+# Regeneration Cache Tests
+# ────────────────────────────────────────────────────────────────────────────
+
+class TestDashboardCache:
+    """Tests for skipping regeneration when the rendered data is unchanged."""
+
+    @pytest.fixture
+    def writes(self, monkeypatch) -> list[dict]:
+        """Record the data of every page render."""
+        renders: list[dict] = []
+        write_html = dashboard._write_html
+
+        def recording_write_html(f, data) -> None:
+            renders.append(data)
+            write_html(f, data)
+
+        monkeypatch.setattr(dashboard, "_write_html", recording_write_html)
+        return renders
+
+    def test_unchanged_data_is_not_rewritten(self, tmp_path: Path, writes: list) -> None:
+        """A second build with the same data hits the cache."""
+        engine, transactions, alerts = _evaluated_batch()
+        output = str(tmp_path / "dashboard.html")
+
+        generate_dashboard(engine, transactions, alerts, output, precompress=False)
+        generate_dashboard(engine, transactions, alerts, output, precompress=False)
+
+        assert len(writes) == 1
+
+    def test_changed_non_alert_row_is_rewritten(self, tmp_path: Path, writes: list) -> None:
+        """Any change a chart shows misses the cache, even with equal alert scores."""
+        engine, transactions, alerts = _evaluated_batch()
+        output = str(tmp_path / "dashboard.html")
+
+        generate_dashboard(engine, transactions, alerts, output, precompress=False)
+        transactions[3].hour = 9
+        generate_dashboard(engine, transactions, alerts, output, precompress=False)
+
+        assert len(writes) == 2
+        assert writes[1]["legit_by_hour"][9] == 1
+
+    def test_gzip_copy_matches_page(self, tmp_path: Path, writes: list) -> None:
+        """The page is rendered once, and the .gz copy decompresses to it."""
+        engine, transactions, alerts = _evaluated_batch()
+        output = tmp_path / "dashboard.html"
+
+        generate_dashboard(engine, transactions, alerts, str(output))
+
+        assert len(writes) == 1
+        with gzip.open(f"{output}.gz", "rb") as gz:
+            assert gz.read() == output.read_bytes()
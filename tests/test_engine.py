@@ -6,17 +6,19 @@ batch evaluation, alert generation, and risk classification.
 """
 
 import sys
-from pathlib import Path
+from dataclasses import asdict
+from types import MappingProxyType
 
+import numpy as np
+import pandas as pd
 import pytest
 
-# Ensure project root is importable
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
+from src import engine_numba
 from src.engine import FraudEngine
 from src.loader import Transaction
 from src.rules import (
     ForeignTxRule,
+    FraudRule,
     HighAmountRule,
     LocationChangeRule,
     NewDeviceRule,
@@ -44,31 +46,39 @@ SAMPLE_CONFIG: dict = {
 }
 
 
+# Field values of a clean transaction; tests override only what they check
+_DEFAULTS = MappingProxyType({
+    "transaction_id": "tx-integration-001",
+    "user_id": "user-001",
+    "timestamp": "2023-06-01 12:00:00",
+    "amount": 500.0,
+    "merchant": "TestMerchant",
+    "category": "Services",
+    "location": "CDMX",
+    "is_fraud": 0,
+    "hour": 12,
+    "day_of_week": 3,
+    "is_weekend": 0,
+    "month": 6,
+    "is_odd_hour": 0,
+    "user_avg_amount": 1000.0,
+    "amount_vs_avg_ratio": 0.5,
+    "hours_since_last_tx": 24.0,
+    "location_changed": 0,
+    "is_foreign_location": 0,
+    "device_id": "device-main",
+})
+
+
 def _make_transaction(**overrides) -> Transaction:
     """Factory helper for creating Transaction fixtures."""
-    defaults = {
-        "transaction_id": "tx-integration-001",
-        "user_id": "user-001",
-        "timestamp": "2023-06-01 12:00:00",
-        "amount": 500.0,
-        "merchant": "TestMerchant",
-        "category": "Services",
-        "location": "CDMX",
-        "is_fraud": 0,
-        "hour": 12,
-        "day_of_week": 3,
-        "is_weekend": 0,
-        "month": 6,
-        "is_odd_hour": 0,
-        "user_avg_amount": 1000.0,
-        "amount_vs_avg_ratio": 0.5,
-        "hours_since_last_tx": 24.0,
-        "location_changed": 0,
-        "is_foreign_location": 0,
-        "device_id": "device-main",
-    }
-    defaults.update(overrides)
-    return Transaction(**defaults)
+    return Transaction(**{**_DEFAULTS, **overrides})
+
+
+def _make_transactions(n: int, **overrides) -> list[Transaction]:
+    """Create `n` transactions with IDs tx-0 .. tx-{n-1} and shared overrides."""
+    base = {**_DEFAULTS, **overrides}
+    return [Transaction(**{**base, "transaction_id": f"tx-{i}"}) for i in range(n)]
 
 
 def _build_engine() -> FraudEngine:
@@ -87,6 +97,38 @@ def _build_engine() -> FraudEngine:
     return engine
 
 
+@pytest.fixture(scope="module")
+def engine() -> FraudEngine:
+    """Fully-configured engine shared by the tests of this module.
+
+    Rules hold no state, so tests may evaluate batches with it; tests
+    that register extra rules use `fresh_engine` instead.
+    """
+    return _build_engine()
+
+
+@pytest.fixture
+def fresh_engine() -> FraudEngine:
+    """Fully-configured engine owned by a single test."""
+    return _build_engine()
+
+
+class _FailingRule(FraudRule):
+    """Rule stub whose evaluation always raises."""
+
+    def evaluate(self, transaction: Transaction, **kwargs) -> int:
+        raise RuntimeError("rule failure")
+
+
+class _VipExemptRule(HighAmountRule):
+    """Built-in rule subclass that changes the condition in evaluate() only."""
+
+    def evaluate(self, transaction: Transaction, **kwargs) -> int:
+        if transaction.user_id.startswith("vip-"):
+            return 0
+        return super().evaluate(transaction, **kwargs)
+
+
 # ── Engine Initialization Tests ────────────────────────────────────────────
 
 class TestEngineInit:
@@ -98,14 +140,29 @@ class TestEngineInit:
         assert engine.alert_threshold == 75
         assert engine.critical_threshold == 120
 
-    def test_all_rules_registered(self) -> None:
+    def test_jit_warmup_is_opt_in(self, monkeypatch) -> None:
+        """The fused kernel is only warmed up when the config asks for it."""
+        calls = []
+        monkeypatch.setattr(engine_numba, "warmup", lambda: calls.append(True))
+        FraudEngine(SAMPLE_CONFIG)
+        assert calls == []
+        FraudEngine({**SAMPLE_CONFIG, "engine": {"jit_warmup": True}})
+        assert calls == [True]
+
+    def test_all_rules_registered(self, engine: FraudEngine) -> None:
         """Engine should have 7 rules after full registration."""
-        engine = _build_engine()
         assert len(engine.rules) == 7
 
-    def test_rule_names_are_correct(self) -> None:
+    def test_rule_table_packs_registered_rules(self, fresh_engine: FraudEngine) -> None:
+        """The rule table holds one (threshold, points, kind) record per rule."""
+        fresh_engine.register_rule(_FailingRule({}))
+        table = fresh_engine._rule_table
+        assert table["pts"].tolist() == [50, 30, 40, 35, 30, 25, 20, 0]
+        assert table["th"][0] == 15000.0
+        assert table["kind"].tolist() == [0, 1, 2, 3, 4, 5, 6, -1]
+
+    def test_rule_names_are_correct(self, engine: FraudEngine) -> None:
         """Each registered rule should have the correct class name."""
-        engine = _build_engine()
         rule_names = [r.name for r in engine.rules]
         assert "HighAmountRule" in rule_names
         assert "VelocityRule" in rule_names
@@ -117,17 +174,15 @@ class TestEngineInit:
 class TestSingleEvaluation:
     """Tests for evaluating individual transactions."""
 
-    def test_clean_transaction_gets_zero_score(self) -> None:
+    def test_clean_transaction_gets_zero_score(self, engine: FraudEngine) -> None:
         """A completely normal transaction should have score 0."""
-        engine = _build_engine()
         tx = _make_transaction()
         result = engine.evaluate_transaction(tx, user_device_map={"user-001": "device-main"})
         assert result.risk_score == 0
         assert result.triggered_rules == []
 
-    def test_high_risk_transaction_triggers_multiple_rules(self) -> None:
+    def test_high_risk_transaction_triggers_multiple_rules(self, engine: FraudEngine) -> None:
         """A suspicious transaction should accumulate points from multiple rules."""
-        engine = _build_engine()
         tx = _make_transaction(
             amount=20000.0,           # HighAmountRule: +50
             is_odd_hour=1,            # OddHoursRule: +30
@@ -137,10 +192,10 @@ class TestSingleEvaluation:
         result = engine.evaluate_transaction(tx, user_device_map={"user-001": "device-main"})
         assert result.risk_score == 50 + 30 + 40 + 35  # 155
         assert len(result.triggered_rules) == 4
+        assert result.triggered_rules[0] == ("HighAmountRule", 50)
 
-    def test_foreign_transaction_with_new_device(self) -> None:
+    def test_foreign_transaction_with_new_device(self, engine: FraudEngine) -> None:
         """Foreign location + new device should accumulate both scores."""
-        engine = _build_engine()
         tx = _make_transaction(
             is_foreign_location=1,    # ForeignTxRule: +25
             device_id="device-new",   # NewDeviceRule: +20
@@ -150,25 +205,118 @@ class TestSingleEvaluation:
         assert result.risk_score == 45  # 25 + 20
         assert len(result.triggered_rules) == 2
 
+    def test_short_circuit_stops_at_critical(self, engine: FraudEngine) -> None:
+        """With short_circuit on, scoring should stop once CRITICAL is reached."""
+        short_circuit = FraudEngine({**SAMPLE_CONFIG, "engine": {"short_circuit": True}})
+        short_circuit.register_rules(engine.rules)
+        tx = _make_transaction(
+            amount=20000.0,           # HighAmountRule: +50
+            is_odd_hour=1,            # OddHoursRule: +30
+            hours_since_last_tx=0.05, # VelocityRule: +40
+            amount_vs_avg_ratio=5.0,  # UnusualAmountRule: +35
+        )
+        result = short_circuit.evaluate_transaction(tx)
+        assert result.risk_score == 50 + 40 + 35  # highest points first
+        assert short_circuit.classify_risk_level(result) == "CRITICAL"
+        assert short_circuit.rules[1].name == "OddHoursRule"  # registration order kept
+
+    def test_short_circuit_matches_in_columnar_path(self, engine: FraudEngine) -> None:
+        """Vectorized scoring should honor short_circuit like row evaluation."""
+        config = {**SAMPLE_CONFIG, "engine": {"short_circuit": True}}
+        transactions = [
+            _make_transaction(
+                transaction_id=f"tx-{i}",
+                amount=20000.0,
+                is_odd_hour=1,
+                hours_since_last_tx=0.05 * i,
+                amount_vs_avg_ratio=5.0,
+            )
+            for i in range(6)
+        ]
+        expected_engine = FraudEngine(config)
+        expected_engine.register_rules(engine.rules)
+        expected = [
+            (tx.risk_score, tx.triggered_rules)
+            for tx in expected_engine.evaluate_all(transactions)
+        ]
+        vectorized_engine = FraudEngine(config)
+        vectorized_engine.register_rules(engine.rules)
+        results = vectorized_engine.evaluate_all_vectorized(transactions)
+        assert [(tx.risk_score, tx.triggered_rules) for tx in results] == expected
+        assert expected[0][0] == 125 and expected[5][0] == 115
+
+    @pytest.mark.parametrize("short_circuit", [False, True])
+    def test_generated_scorer_matches_rule_by_rule(
+        self, engine: FraudEngine, short_circuit: bool,
+    ) -> None:
+        """The inlined scorer of the built-in rules scores like calling each rule."""
+        config = {**SAMPLE_CONFIG, "engine": {"short_circuit": short_circuit}}
+        device_map = {"user-001": "device-main"}
+        transactions = [
+            _make_transaction(
+                transaction_id=f"tx-{i}",
+                user_id="user-001" if i % 5 else "user-new",
+                amount=4000.0 * i,
+                is_odd_hour=i % 2,
+                hours_since_last_tx=0.1 * i,
+                amount_vs_avg_ratio=0.5 * i,
+                location_changed=i % 3 == 0,
+                is_foreign_location=i % 4 == 0,
+                device_id="device-main" if i % 3 else "device-new",
+            )
+            for i in range(15)
+        ]
+        generated = FraudEngine(config)
+        generated.register_rules(engine.rules)
+        rule_by_rule = FraudEngine(config)
+        rule_by_rule.register_rules(engine.rules)
+        rule_by_rule._scorer = None
+
+        assert generated._scorer is not None
+        expected = [
+            (tx.risk_score, tx.triggered_rules)
+            for tx in rule_by_rule.evaluate_all(transactions, user_device_map=device_map)
+        ]
+        results = generated.evaluate_all(transactions, user_device_map=device_map)
+        assert [(tx.risk_score, tx.triggered_rules) for tx in results] == expected
+
+    def test_generated_scorer_failure_falls_back_to_each_rule(self, engine: FraudEngine) -> None:
+        """A value a rule cannot compare only skips that rule in safe mode."""
+        result = engine.evaluate_transaction(_make_transaction(amount=None, is_odd_hour=1))
+        assert result.triggered_rules == [("OddHoursRule", 30)]
+
+        strict = FraudEngine({**SAMPLE_CONFIG, "engine": {"safe_mode": False}})
+        strict.register_rules(engine.rules)
+        with pytest.raises(TypeError):
+            strict.evaluate_transaction(_make_transaction(amount=None))
+
+    def test_failing_rule_is_skipped_in_safe_mode(self, fresh_engine: FraudEngine) -> None:
+        """A rule that raises should be skipped without losing other scores."""
+        fresh_engine.register_rule(_FailingRule({}))
+        result = fresh_engine.evaluate_transaction(_make_transaction(is_odd_hour=1))
+        assert result.risk_score == 30
+
+    def test_failing_rule_propagates_without_safe_mode(self) -> None:
+        """With safe_mode disabled, rule errors should reach the caller."""
+        engine = FraudEngine({**SAMPLE_CONFIG, "engine": {"safe_mode": False}})
+        engine.register_rule(_FailingRule({}))
+        with pytest.raises(RuntimeError):
+            engine.evaluate_all([_make_transaction()])
+
 
 # ── Batch Evaluation Tests ─────────────────────────────────────────────────
 
 class TestBatchEvaluation:
     """Tests for batch evaluation of multiple transactions."""
 
-    def test_batch_processes_all_transactions(self) -> None:
+    def test_batch_processes_all_transactions(self, engine: FraudEngine) -> None:
         """All transactions should be processed and returned."""
-        engine = _build_engine()
-        transactions = [
-            _make_transaction(transaction_id=f"tx-{i}")
-            for i in range(50)
-        ]
+        transactions = _make_transactions(50)
         results = engine.evaluate_all(transactions, user_device_map={})
         assert len(results) == 50
 
-    def test_batch_handles_mixed_risk_levels(self) -> None:
+    def test_batch_handles_mixed_risk_levels(self, engine: FraudEngine) -> None:
         """Batch should correctly evaluate transactions with varying risk."""
-        engine = _build_engine()
         transactions = [
             _make_transaction(transaction_id="clean", amount=100),
             _make_transaction(transaction_id="risky", amount=20000, is_odd_hour=1),
@@ -180,15 +328,183 @@ class TestBatchEvaluation:
         assert results[0].risk_score == 0
         assert results[1].risk_score == 80  # 50 + 30
 
+    def test_parallel_matches_sequential(self, engine: FraudEngine) -> None:
+        """Parallel evaluation should return the same scores in input order."""
+        transactions = [
+            _make_transaction(transaction_id=f"tx-{i}", amount=1000.0 * i, is_odd_hour=i % 2)
+            for i in range(40)
+        ]
+        results = engine.evaluate_parallel(
+            transactions,
+            max_workers=2,
+            min_rows=0,
+            user_device_map={"user-001": "device-main"},
+        )
+        assert [tx.transaction_id for tx in results] == [f"tx-{i}" for i in range(40)]
+        assert results[21].risk_score == 80  # 50 + 30
+        assert results[1].risk_score == 30
+
+    def test_parallel_after_vectorized_evaluation(self, engine: FraudEngine) -> None:
+        """Worker processes should start cleanly after the fused kernel ran."""
+        device_map = {"user-001": "device-main"}
+        transactions = [
+            _make_transaction(transaction_id=f"tx-{i}", amount=1000.0 * i)
+            for i in range(40)
+        ]
+        expected = [
+            tx.risk_score
+            for tx in engine.evaluate_all_vectorized(transactions, user_device_map=device_map)
+        ]
+        results = engine.evaluate_parallel(
+            transactions, max_workers=2, min_rows=0, user_device_map=device_map,
+        )
+        assert [tx.risk_score for tx in results] == expected
+
+    def test_dataframe_matches_row_evaluation(self, engine: FraudEngine) -> None:
+        """Vectorized DataFrame evaluation should match evaluate_all."""
+        transactions = [
+            _make_transaction(
+                transaction_id=f"tx-{i}",
+                amount=4000.0 * i,
+                is_odd_hour=i % 2,
+                hours_since_last_tx=0.1 * i,
+                location_changed=i % 3 == 0,
+                device_id=f"device-{i % 4}",
+            )
+            for i in range(12)
+        ]
+        df = pd.DataFrame([asdict(tx) for tx in transactions])
+        device_map = {"user-001": "device-0"}
+
+        vectorized = engine.evaluate_dataframe(df, user_device_map=device_map)
+        expected = engine.evaluate_all(transactions, user_device_map=device_map)
+        assert [tx.risk_score for tx in vectorized] == [tx.risk_score for tx in expected]
+        assert [tx.triggered_rules for tx in vectorized] == [
+            tx.triggered_rules for tx in expected
+        ]
+
+    def test_vectorized_objects_match_row_evaluation(self, engine: FraudEngine) -> None:
+        """Column-wise evaluation of Transaction objects should match evaluate_all."""
+        device_map = {"user-001": "device-main"}
+        transactions = [
+            _make_transaction(
+                transaction_id=f"tx-{i}",
+                amount=4000.0 * i,
+                is_foreign_location=i % 2,
+                device_id="device-main" if i % 3 else "device-new",
+            )
+            for i in range(10)
+        ]
+        expected = [
+            (tx.risk_score, tx.triggered_rules)
+            for tx in engine.evaluate_all(transactions, user_device_map=device_map)
+        ]
+        results = engine.evaluate_all_vectorized(transactions, user_device_map=device_map)
+        assert [(tx.risk_score, tx.triggered_rules) for tx in results] == expected
+
+    def test_missing_user_id_never_flags_new_device(self, engine: FraudEngine) -> None:
+        """A missing user ID has no known device, in every scoring path."""
+        device_map = {"user-001": "device-main", "user-zzz": "device-main"}
+        transactions = [
+            _make_transaction(transaction_id="tx-known", user_id="user-001"),
+            _make_transaction(transaction_id="tx-last", user_id="user-zzz"),
+            _make_transaction(transaction_id="tx-missing", user_id=None, device_id="device-new"),
+        ]
+        expected = [
+            tx.risk_score
+            for tx in engine.evaluate_all(transactions, user_device_map=device_map)
+        ]
+        results = engine.evaluate_all_vectorized(transactions, user_device_map=device_map)
+        assert [tx.risk_score for tx in results] == expected == [0, 0, 0]
+
+    def test_numpy_masks_match_row_evaluation(self, engine: FraudEngine, monkeypatch) -> None:
+        """Without Numba, the per-rule NumPy masks should match evaluate_all."""
+        monkeypatch.setattr(engine_numba, "NUMBA_AVAILABLE", False)
+        device_map = {"user-001": "device-main"}
+        transactions = [
+            _make_transaction(
+                transaction_id=f"tx-{i}",
+                amount=4000.0 * i,
+                is_odd_hour=i % 2,
+                hours_since_last_tx=0.1 * i,
+                amount_vs_avg_ratio=0.5 * i,
+                location_changed=i % 3 == 0,
+                is_foreign_location=i % 4 == 0,
+                device_id="device-main" if i % 3 else "device-new",
+            )
+            for i in range(12)
+        ]
+        expected = [
+            (tx.risk_score, tx.triggered_rules)
+            for tx in engine.evaluate_all(transactions, user_device_map=device_map)
+        ]
+        results = engine.evaluate_all_vectorized(transactions, user_device_map=device_map)
+        assert [(tx.risk_score, tx.triggered_rules) for tx in results] == expected
+        assert engine.scores.dtype == np.int16
+
+    @pytest.mark.skipif(not engine_numba.NUMBA_AVAILABLE, reason="Numba is not installed")
+    def test_single_threaded_kernel_matches_parallel(
+        self, engine: FraudEngine, monkeypatch,
+    ) -> None:
+        """Batches below parallel_min_batch score the same on one thread."""
+        modes = []
+        score_builtin = engine_numba.score_builtin
+
+        def recording_score_builtin(*args, parallel: bool) -> tuple:
+            modes.append(parallel)
+            return score_builtin(*args, parallel=parallel)
+
+        monkeypatch.setattr(engine_numba, "score_builtin", recording_score_builtin)
+        df = pd.DataFrame([
+            asdict(_make_transaction(
+                transaction_id=f"tx-{i}",
+                amount=4000.0 * i,
+                is_odd_hour=i % 2,
+                is_foreign_location=i % 3 == 0,
+                device_id="device-main" if i % 4 else "device-new",
+            ))
+            for i in range(12)
+        ])
+        device_map = {"user-001": "device-main"}
+        results = {}
+        for min_batch in (0, 13):
+            batch_engine = FraudEngine(
+                {**SAMPLE_CONFIG, "engine": {"parallel_min_batch": min_batch}},
+            )
+            batch_engine.register_rules(engine.rules)
+            results[min_batch] = [
+                (tx.risk_score, tx.triggered_rules)
+                for tx in batch_engine.evaluate_dataframe(df, user_device_map=device_map)
+            ]
+
+        assert modes == [True, False]
+        assert results[13] == results[0]
+
+    @pytest.mark.parametrize("numba_available", [True, False])
+    def test_subclass_overriding_evaluate_is_scored_row_by_row(
+        self, monkeypatch, numba_available: bool,
+    ) -> None:
+        """An inherited mask or kernel slot must not replace an overridden evaluate()."""
+        monkeypatch.setattr(
+            engine_numba, "NUMBA_AVAILABLE", engine_numba.NUMBA_AVAILABLE and numba_available,
+        )
+        engine = FraudEngine(SAMPLE_CONFIG)
+        engine.register_rule(_VipExemptRule(SAMPLE_CONFIG["rules"]["high_amount"]))
+        transactions = [
+            _make_transaction(transaction_id="tx-vip", user_id="vip-001", amount=20000.0),
+            _make_transaction(transaction_id="tx-std", amount=20000.0),
+        ]
+        results = engine.evaluate_all_vectorized(transactions)
+        assert [tx.risk_score for tx in results] == [0, 50]
+
 
 # ── Alert Generation Tests ─────────────────────────────────────────────────
 
 class TestAlertGeneration:
     """Tests for fraud alert filtering and classification."""
 
-    def test_alerts_filter_by_threshold(self) -> None:
+    def test_alerts_filter_by_threshold(self, engine: FraudEngine) -> None:
         """Only transactions above alert threshold should be returned."""
-        engine = _build_engine()
         transactions = [
             _make_transaction(transaction_id="low"),
             _make_transaction(
@@ -207,9 +523,58 @@ class TestAlertGeneration:
         assert len(alerts) == 1
         assert alerts[0].transaction_id == "high"
 
-    def test_risk_level_classification(self) -> None:
+    def test_evaluate_and_alert_matches_filtered_batch(self, engine: FraudEngine) -> None:
+        """Only the alerting rows come back, scored as in the full batch."""
+        df = pd.DataFrame([
+            asdict(_make_transaction(
+                transaction_id=f"tx-{i}",
+                amount=5000.0 * i,
+                is_odd_hour=i % 2,
+                hours_since_last_tx=0.1 * i,
+            ))
+            for i in range(10)
+        ])
+        device_map = {"user-001": "device-main"}
+        evaluated = engine.evaluate_dataframe(df, user_device_map=device_map)
+        expected = [
+            (tx.transaction_id, tx.risk_score, tx.triggered_rules)
+            for tx in engine.get_alerts(evaluated, scores=engine.scores)
+        ]
+        alerts = engine.evaluate_and_alert(df, user_device_map=device_map)
+        assert [(tx.transaction_id, tx.risk_score, tx.triggered_rules) for tx in alerts] == expected
+        assert 0 < len(alerts) < len(df)
+
+    def test_evaluate_and_alert_without_vectorized_form(self, fresh_engine: FraudEngine) -> None:
+        """A rule without a batch form falls back to filtering a row-by-row batch."""
+        fresh_engine.register_rule(_FailingRule({}))
+        df = pd.DataFrame([
+            asdict(_make_transaction(transaction_id="tx-alert", amount=20000.0, is_odd_hour=1)),
+            asdict(_make_transaction(transaction_id="tx-clean")),
+        ])
+        alerts = fresh_engine.evaluate_and_alert(df)
+        assert [(tx.transaction_id, tx.risk_score) for tx in alerts] == [("tx-alert", 80)]
+
+    def test_alerts_from_score_array(self, engine: FraudEngine) -> None:
+        """A score array should select the same alerts as the objects."""
+        transactions = _make_transactions(4)
+        alerts = engine.get_alerts(transactions, scores=np.array([80, 10, 75, 74]))
+        assert [tx.transaction_id for tx in alerts] == ["tx-0", "tx-2"]
+
+    def test_scores_are_reset_by_row_evaluation(self, engine: FraudEngine) -> None:
+        """After a row-by-row batch, engine.scores no longer holds the previous batch."""
+        engine.evaluate_all_vectorized([_make_transaction(amount=20000.0, is_odd_hour=1)])
+        batch = _make_transactions(5)
+        engine.evaluate_all(batch)
+        assert engine.scores is None
+        assert engine.get_alerts(batch, scores=engine.scores) == []
+
+    def test_misaligned_scores_are_rejected(self, engine: FraudEngine) -> None:
+        """A score array from another batch should raise instead of misfiring."""
+        with pytest.raises(ValueError):
+            engine.get_alerts([_make_transaction()], scores=np.array([0, 100]))
+
+    def test_risk_level_classification(self, engine: FraudEngine) -> None:
         """CRITICAL should be assigned for very high scores."""
-        engine = _build_engine()
         # Build a transaction that triggers many rules
         tx = _make_transaction(
             amount=20000,                # +50
@@ -222,9 +587,8 @@ class TestAlertGeneration:
         # Score = 50+30+40+35+25 = 180 → CRITICAL (>= 120)
         assert engine.classify_risk_level(tx) == "CRITICAL"
 
-    def test_high_risk_level(self) -> None:
+    def test_high_risk_level(self, engine: FraudEngine) -> None:
         """HIGH should be assigned for scores between alert and critical thresholds."""
-        engine = _build_engine()
         tx = _make_transaction(
             amount=20000,     # +50
             is_odd_hour=1,    # +30
@@ -233,15 +597,25 @@ class TestAlertGeneration:
         # Score = 80 → HIGH (>= 75 but < 120)
         assert engine.classify_risk_level(tx) == "HIGH"
 
+    def test_classify_all_matches_per_transaction(self, engine: FraudEngine) -> None:
+        """Vectorized classification should agree with classify_risk_level."""
+        levels = engine.classify_all(np.array([80, 119, 120, 200]))
+        assert levels.tolist() == ["HIGH", "HIGH", "CRITICAL", "CRITICAL"]
+
+    def test_classified_levels_are_shared_strings(self, engine: FraudEngine) -> None:
+        """Every label from classify_all is one interned string, not a copy per score."""
+        levels = engine.classify_all(np.array([80, 200, 90, 130])).tolist()
+        assert levels[0] is levels[2] is sys.intern("HIGH")
+        assert levels[1] is levels[3] is sys.intern("CRITICAL")
+
 
 # ── Rule Statistics Tests ──────────────────────────────────────────────────
 
 class TestRuleStatistics:
     """Tests for rule trigger statistics."""
 
-    def test_statistics_count_correctly(self) -> None:
+    def test_statistics_count_correctly(self, engine: FraudEngine) -> None:
         """Rule statistics should accurately count triggers."""
-        engine = _build_engine()
         transactions = [
             _make_transaction(transaction_id="a", amount=20000),           # HighAmountRule
             _make_transaction(transaction_id="b", amount=20000, is_odd_hour=1),  # Both
@@ -255,9 +629,8 @@ class TestRuleStatistics:
         assert stats["HighAmountRule"] == 2
         assert stats["OddHoursRule"] == 2
 
-    def test_empty_statistics(self) -> None:
+    def test_empty_statistics(self, engine: FraudEngine) -> None:
         """No triggers should produce empty statistics."""
-        engine = _build_engine()
         transactions = [_make_transaction()]
         evaluated = engine.evaluate_all(
             transactions,
@@ -265,3 +638,33 @@ class TestRuleStatistics:
         )
         stats = engine.get_rule_statistics(evaluated)
         assert len(stats) == 0
+
+    def test_statistics_from_trigger_bits(self, engine: FraudEngine) -> None:
+        """Counting packed trigger bits matches counting triggered_rules, order included."""
+        transactions = [
+            _make_transaction(
+                transaction_id=f"tx-{i}",
+                amount=8000.0 * i,
+                is_odd_hour=i % 2,
+                is_foreign_location=i % 3 == 2,
+                device_id="device-new" if i % 3 == 1 else "device-main",
+            )
+            for i in range(6)
+        ]
+        evaluated = engine.evaluate_all_vectorized(
+            transactions, user_device_map={"user-001": "device-main"},
+        )
+        stats = engine.get_rule_statistics(evaluated, trigger_bits=engine.trigger_bits)
+        assert engine.trigger_bits.shape == (6, 1)
+        # Tied counts keep first-seen order: NewDeviceRule fires on an earlier row
+        assert list(stats.items()) == [
+            ("HighAmountRule", 4), ("OddHoursRule", 3),
+            ("NewDeviceRule", 2), ("ForeignTxRule", 2),
+        ]
+        assert list(stats.items()) == list(engine.get_rule_statistics(evaluated).items())
+
+    def test_misaligned_trigger_bits_are_rejected(self, engine: FraudEngine) -> None:
+        """Trigger bits from another batch should raise instead of miscounting."""
+        engine.evaluate_all_vectorized([_make_transaction(), _make_transaction()])
+        with pytest.raises(ValueError):
+            engine.get_rule_statistics([_make_transaction()], trigger_bits=engine.trigger_bits)
@@ -0,0 +1,181 @@
+"""
+Unit tests for the data loader.
+
+Tests CSV ingestion, type coercion of corrupt or missing values,
+and the per-user lookups derived from a dataset.
+"""
+
+from dataclasses import astuple
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src import loader
+from src.loader import (
+    FLOAT_COLUMNS,
+    INT_COLUMNS,
+    REQUIRED_COLUMNS,
+    Transaction,
+    compute_user_device_map,
+    dataframe_to_columns,
+    dataframe_to_transactions,
+    known_device_codes,
+    load_dataset,
+)
+
+CSV_HEADER = ",".join(REQUIRED_COLUMNS)
+
+
+def _csv_row(**overrides) -> str:
+    """Build one CSV line with sensible defaults."""
+    defaults = {
+        "transaction_id": "tx-001",
+        "user_id": "user-001",
+        "timestamp": "2023-06-01T12:00:00Z",
+        "amount": "500.0",
+        "merchant": "TestMerchant",
+        "category": "Services",
+        "location": "CDMX",
+        "is_fraud": "0",
+        "hour": "12",
+        "day_of_week": "3",
+        "is_weekend": "0",
+        "month": "6",
+        "is_odd_hour": "0",
+        "user_avg_amount": "1000.0",
+        "amount_vs_avg_ratio": "0.5",
+        "hours_since_last_tx": "24.0",
+        "location_changed": "0",
+        "is_foreign_location": "0",
+        "device_id": "device-main",
+    }
+    defaults.update(overrides)
+    return ",".join(defaults[col] for col in REQUIRED_COLUMNS)
+
+
+def _write_csv(tmp_path: Path, rows: list[str]) -> str:
+    """Write a dataset CSV and return its path."""
+    path = tmp_path / "transactions.csv"
+    path.write_text("\n".join([CSV_HEADER, *rows]) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def _convert_row_by_row(df: pd.DataFrame) -> list[Transaction]:
+    """Reference converter: one str()/int()/float() call per value."""
+    transactions = []
+    for _, row in df.iterrows():
+        try:
+            values = [
+                int(row[col]) if col in INT_COLUMNS
+                else float(row[col]) if col in FLOAT_COLUMNS
+                else str(row[col])
+                for col in REQUIRED_COLUMNS
+            ]
+        except (ValueError, TypeError):
+            continue
+        transactions.append(Transaction(*values))
+    return transactions
+
+
+def _as_tuples(transactions: list[Transaction]) -> list[tuple]:
+    """Field tuples with NaN replaced, so they compare equal."""
+    return [
+        tuple("NaN" if value != value else value for value in astuple(tx))
+        for tx in transactions
+    ]
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Type Coercion Tests
+# ────────────────────────────────────────────────────────────────────────────
+
+class TestDataframeToTransactions:
+    """Tests for converting loaded rows into Transaction records."""
+
+    def test_missing_and_corrupt_values_match_row_conversion(self, tmp_path: Path) -> None:
+        """Corrupt rows are skipped and missing values kept exactly as per-row conversion."""
+        path = _write_csv(tmp_path, [
+            _csv_row(transaction_id="tx-clean"),
+            _csv_row(transaction_id="tx-first", hours_since_last_tx=""),
+            _csv_row(transaction_id="tx-bad-hour", hour="abc"),
+            _csv_row(transaction_id="tx-frac-hour", hour="5.7"),
+            _csv_row(transaction_id="", user_id=""),
+            _csv_row(transaction_id="tx-bad-amount", amount="abc"),
+            _csv_row(transaction_id="tx-no-flag", is_fraud=""),
+        ])
+        df = load_dataset(path)
+
+        transactions = dataframe_to_transactions(df)
+
+        assert _as_tuples(transactions) == _as_tuples(_convert_row_by_row(df))
+        assert [tx.transaction_id for tx in transactions] == ["tx-clean", "tx-first", "nan"]
+        assert np.isnan(transactions[1].hours_since_last_tx)
+        assert transactions[2].user_id == "nan"
+
+    def test_numeric_hour_is_truncated_like_int(self, tmp_path: Path) -> None:
+        """A fractional value in an all-numeric int column truncates like int()."""
+        df = load_dataset(_write_csv(tmp_path, [_csv_row(hour="5.7")]))
+        assert dataframe_to_transactions(df)[0].hour == 5
+
+    def test_corrupt_rows_are_logged_and_skipped(self, tmp_path: Path, caplog) -> None:
+        """Each skipped row is logged by index, followed by the total."""
+        df = load_dataset(_write_csv(tmp_path, [
+            _csv_row(transaction_id="tx-ok"),
+            _csv_row(transaction_id="tx-bad", month="june"),
+        ]))
+        with caplog.at_level("WARNING", logger="fraud_engine.loader"):
+            transactions = dataframe_to_transactions(df)
+
+        assert [tx.transaction_id for tx in transactions] == ["tx-ok"]
+        assert "Skipping corrupt row at index 1" in caplog.text
+        assert "Total rows skipped due to data issues: 1" in caplog.text
+
+    def test_timestamp_is_kept_verbatim(self, tmp_path: Path) -> None:
+        """Timestamps are reported exactly as written in the CSV."""
+        df = load_dataset(_write_csv(tmp_path, [_csv_row()]))
+        assert dataframe_to_transactions(df)[0].timestamp == "2023-06-01T12:00:00Z"
+
+    def test_pyarrow_reader_matches_default_parser(self, tmp_path: Path, monkeypatch) -> None:
+        """Records are identical whether or not the PyArrow reader is used."""
+        path = _write_csv(tmp_path, [
+            _csv_row(transaction_id=f"tx-{i}", hour=str(i), amount=f"{i}.25")
+            for i in range(5)
+        ] + [_csv_row(transaction_id="", merchant="")])
+        with_arrow = dataframe_to_transactions(load_dataset(path))
+        monkeypatch.setattr(loader, "PYARROW_AVAILABLE", False)
+        without_arrow = dataframe_to_transactions(load_dataset(path))
+        assert _as_tuples(with_arrow) == _as_tuples(without_arrow)
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# User Device Lookup Tests
+# ────────────────────────────────────────────────────────────────────────────
+
+class TestUserDeviceMap:
+    """Tests for the most-frequent-device lookup per user."""
+
+    def test_matches_mode_including_ties(self) -> None:
+        """Each user maps to Series.mode()'s first device, ties included."""
+        df = pd.DataFrame({
+            "user_id": ["u1", "u1", "u1", "u2", "u2", "u3", "u3"],
+            "device_id": ["d2", "d1", "d2", "d9", "d3", "d5", "d4"],
+        })
+        expected = {
+            str(user): str(devices.mode().iloc[0])
+            for user, devices in df.groupby("user_id")["device_id"]
+        }
+        assert compute_user_device_map(df) == expected == {"u1": "d2", "u2": "d3", "u3": "d4"}
+
+    def test_known_device_codes(self) -> None:
+        """Known devices encode as batch codes, -1 for no entry, -2 if absent."""
+        df = pd.DataFrame([
+            {col: 0 for col in INT_COLUMNS + FLOAT_COLUMNS}
+            | {"transaction_id": f"tx-{i}", "user_id": user, "device_id": device}
+            for i, (user, device) in enumerate([("u1", "d1"), ("u2", "d2"), ("u3", "d3")])
+        ])
+        columns = dataframe_to_columns(df)
+        codes = known_device_codes(columns, {"u1": "d2", "u3": "d-elsewhere"})
+
+        assert list(columns.user_ids) == ["u1", "u2", "u3"]
+        assert codes.tolist() == [list(columns.device_ids).index("d2"), -1, -2]
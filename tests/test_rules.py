@@ -2,17 +2,11 @@
 Unit tests for fraud detection rules.
 
 Tests each rule independently with controlled Transaction fixtures.
-Every rule has at least 2 tests: one for triggering and one for not triggering.
+Every rule has at least 2 cases: one for triggering and one for not triggering.
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Ensure project root is importable
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from src.loader import Transaction
 from src.rules import (
     ForeignTxRule,
@@ -68,23 +62,18 @@ def _make_transaction(**overrides) -> Transaction:
 class TestHighAmountRule:
     """Tests for HighAmountRule — flags transactions above a monetary threshold."""
 
-    def setup_method(self) -> None:
-        self.rule = HighAmountRule({"threshold": 15000, "points": 50})
-
-    def test_triggers_above_threshold(self) -> None:
-        """Transaction with amount > threshold should return configured points."""
-        tx = _make_transaction(amount=20000.0)
-        assert self.rule.evaluate(tx) == 50
-
-    def test_does_not_trigger_below_threshold(self) -> None:
-        """Transaction with amount <= threshold should return 0."""
-        tx = _make_transaction(amount=5000.0)
-        assert self.rule.evaluate(tx) == 0
+    @pytest.fixture
+    def rule(self) -> HighAmountRule:
+        return HighAmountRule({"threshold": 15000, "points": 50})
 
-    def test_does_not_trigger_at_exact_threshold(self) -> None:
-        """Amount exactly equal to threshold should NOT trigger (>= vs >)."""
-        tx = _make_transaction(amount=15000.0)
-        assert self.rule.evaluate(tx) == 0
+    @pytest.mark.parametrize("amount, expected", [
+        pytest.param(20000.0, 50, id="above-threshold"),
+        pytest.param(5000.0, 0, id="below-threshold"),
+        pytest.param(15000.0, 0, id="at-threshold"),  # > not >=
+    ])
+    def test_evaluate(self, rule: HighAmountRule, amount: float, expected: int) -> None:
+        """Only amounts strictly above the threshold return the configured points."""
+        assert rule.evaluate(_make_transaction(amount=amount)) == expected
 
     def test_custom_threshold(self) -> None:
         """Rule should respect custom threshold from config."""
@@ -100,18 +89,20 @@ class TestHighAmountRule:
 class TestOddHoursRule:
     """Tests for OddHoursRule — flags transactions during unusual hours."""
 
-    def setup_method(self) -> None:
-        self.rule = OddHoursRule({"start_hour": 22, "end_hour": 5, "points": 30})
+    @pytest.fixture
+    def rule(self) -> OddHoursRule:
+        return OddHoursRule({"start_hour": 22, "end_hour": 5, "points": 30})
 
-    def test_triggers_during_odd_hours(self) -> None:
-        """Transaction with is_odd_hour=1 should return points."""
-        tx = _make_transaction(is_odd_hour=1, hour=2)
-        assert self.rule.evaluate(tx) == 30
-
-    def test_does_not_trigger_during_normal_hours(self) -> None:
-        """Transaction with is_odd_hour=0 should return 0."""
-        tx = _make_transaction(is_odd_hour=0, hour=14)
-        assert self.rule.evaluate(tx) == 0
+    @pytest.mark.parametrize("is_odd_hour, hour, expected", [
+        pytest.param(1, 2, 30, id="odd-hours"),
+        pytest.param(0, 14, 0, id="normal-hours"),
+    ])
+    def test_evaluate(
+        self, rule: OddHoursRule, is_odd_hour: int, hour: int, expected: int,
+    ) -> None:
+        """Transactions flagged is_odd_hour=1 return the configured points."""
+        tx = _make_transaction(is_odd_hour=is_odd_hour, hour=hour)
+        assert rule.evaluate(tx) == expected
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -121,23 +112,21 @@ class TestOddHoursRule:
 class TestVelocityRule:
     """Tests for VelocityRule — flags rapid-fire transactions."""
 
-    def setup_method(self) -> None:
-        self.rule = VelocityRule({"min_hours": 0.17, "points": 40})
-
-    def test_triggers_rapid_transaction(self) -> None:
-        """Transaction <10 min after last should trigger."""
-        tx = _make_transaction(hours_since_last_tx=0.05)
-        assert self.rule.evaluate(tx) == 40
+    @pytest.fixture
+    def rule(self) -> VelocityRule:
+        return VelocityRule({"min_hours": 0.17, "points": 40})
 
-    def test_does_not_trigger_normal_interval(self) -> None:
-        """Transaction with large gap should return 0."""
-        tx = _make_transaction(hours_since_last_tx=5.0)
-        assert self.rule.evaluate(tx) == 0
-
-    def test_boundary_value(self) -> None:
-        """Transaction at exactly the threshold should NOT trigger."""
-        tx = _make_transaction(hours_since_last_tx=0.17)
-        assert self.rule.evaluate(tx) == 0
+    @pytest.mark.parametrize("hours_since_last_tx, expected", [
+        pytest.param(0.05, 40, id="rapid"),
+        pytest.param(5.0, 0, id="normal-interval"),
+        pytest.param(0.17, 0, id="at-threshold"),  # < not <=
+    ])
+    def test_evaluate(
+        self, rule: VelocityRule, hours_since_last_tx: float, expected: int,
+    ) -> None:
+        """Only gaps strictly below the minimum return the configured points."""
+        tx = _make_transaction(hours_since_last_tx=hours_since_last_tx)
+        assert rule.evaluate(tx) == expected
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -147,18 +136,20 @@ class TestVelocityRule:
 class TestUnusualAmountRule:
     """Tests for UnusualAmountRule — flags amounts far above user average."""
 
-    def setup_method(self) -> None:
-        self.rule = UnusualAmountRule({"ratio_threshold": 3.0, "points": 35})
-
-    def test_triggers_high_ratio(self) -> None:
-        """Ratio above threshold should trigger."""
-        tx = _make_transaction(amount_vs_avg_ratio=5.0)
-        assert self.rule.evaluate(tx) == 35
+    @pytest.fixture
+    def rule(self) -> UnusualAmountRule:
+        return UnusualAmountRule({"ratio_threshold": 3.0, "points": 35})
 
-    def test_does_not_trigger_normal_ratio(self) -> None:
-        """Ratio below threshold should return 0."""
-        tx = _make_transaction(amount_vs_avg_ratio=1.5)
-        assert self.rule.evaluate(tx) == 0
+    @pytest.mark.parametrize("amount_vs_avg_ratio, expected", [
+        pytest.param(5.0, 35, id="high-ratio"),
+        pytest.param(1.5, 0, id="normal-ratio"),
+    ])
+    def test_evaluate(
+        self, rule: UnusualAmountRule, amount_vs_avg_ratio: float, expected: int,
+    ) -> None:
+        """Ratios above the threshold return the configured points."""
+        tx = _make_transaction(amount_vs_avg_ratio=amount_vs_avg_ratio)
+        assert rule.evaluate(tx) == expected
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -168,23 +159,27 @@ class TestUnusualAmountRule:
 class TestLocationChangeRule:
     """Tests for LocationChangeRule — flags suspicious location changes."""
 
-    def setup_method(self) -> None:
-        self.rule = LocationChangeRule({"max_hours": 2.0, "points": 30})
-
-    def test_triggers_location_change_fast(self) -> None:
-        """Location change within time window should trigger."""
-        tx = _make_transaction(location_changed=1, hours_since_last_tx=0.5)
-        assert self.rule.evaluate(tx) == 30
-
-    def test_does_not_trigger_no_location_change(self) -> None:
-        """No location change should return 0 even with fast timing."""
-        tx = _make_transaction(location_changed=0, hours_since_last_tx=0.5)
-        assert self.rule.evaluate(tx) == 0
-
-    def test_does_not_trigger_slow_location_change(self) -> None:
-        """Location change with large time gap should return 0."""
-        tx = _make_transaction(location_changed=1, hours_since_last_tx=10.0)
-        assert self.rule.evaluate(tx) == 0
+    @pytest.fixture
+    def rule(self) -> LocationChangeRule:
+        return LocationChangeRule({"max_hours": 2.0, "points": 30})
+
+    @pytest.mark.parametrize("location_changed, hours_since_last_tx, expected", [
+        pytest.param(1, 0.5, 30, id="fast-change"),
+        pytest.param(0, 0.5, 0, id="no-change"),
+        pytest.param(1, 10.0, 0, id="slow-change"),
+    ])
+    def test_evaluate(
+        self,
+        rule: LocationChangeRule,
+        location_changed: int,
+        hours_since_last_tx: float,
+        expected: int,
+    ) -> None:
+        """Only a location change within the time window returns the points."""
+        tx = _make_transaction(
+            location_changed=location_changed, hours_since_last_tx=hours_since_last_tx,
+        )
+        assert rule.evaluate(tx) == expected
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -194,18 +189,18 @@ class TestLocationChangeRule:
 class TestForeignTxRule:
     """Tests for ForeignTxRule — flags foreign location transactions."""
 
-    def setup_method(self) -> None:
-        self.rule = ForeignTxRule({"points": 25})
-
-    def test_triggers_foreign_location(self) -> None:
-        """Foreign location flag should trigger."""
-        tx = _make_transaction(is_foreign_location=1)
-        assert self.rule.evaluate(tx) == 25
+    @pytest.fixture
+    def rule(self) -> ForeignTxRule:
+        return ForeignTxRule({"points": 25})
 
-    def test_does_not_trigger_domestic(self) -> None:
-        """Domestic transaction should return 0."""
-        tx = _make_transaction(is_foreign_location=0)
-        assert self.rule.evaluate(tx) == 0
+    @pytest.mark.parametrize("is_foreign_location, expected", [
+        pytest.param(1, 25, id="foreign"),
+        pytest.param(0, 0, id="domestic"),
+    ])
+    def test_evaluate(self, rule: ForeignTxRule, is_foreign_location: int, expected: int) -> None:
+        """The foreign location flag returns the configured points."""
+        tx = _make_transaction(is_foreign_location=is_foreign_location)
+        assert rule.evaluate(tx) == expected
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -215,21 +210,54 @@ class TestForeignTxRule:
 class TestNewDeviceRule:
     """Tests for NewDeviceRule — flags transactions from unfamiliar devices."""
 
-    def setup_method(self) -> None:
-        self.rule = NewDeviceRule({"points": 20})
-        self.device_map = {"user-001": "device-main"}
+    @pytest.fixture
+    def rule(self) -> NewDeviceRule:
+        return NewDeviceRule({"points": 20})
 
-    def test_triggers_new_device(self) -> None:
-        """Transaction from a different device should trigger."""
-        tx = _make_transaction(device_id="device-unknown")
-        assert self.rule.evaluate(tx, user_device_map=self.device_map) == 20
+    @pytest.mark.parametrize("user_id, device_id, expected", [
+        pytest.param("user-001", "device-unknown", 20, id="new-device"),
+        pytest.param("user-001", "device-main", 0, id="known-device"),
+        # No device history: no false positives
+        pytest.param("unknown-user", "any", 0, id="unknown-user"),
+    ])
+    def test_evaluate(
+        self, rule: NewDeviceRule, user_id: str, device_id: str, expected: int,
+    ) -> None:
+        """Only a device other than the user's known one returns the points."""
+        tx = _make_transaction(user_id=user_id, device_id=device_id)
+        assert rule.evaluate(tx, user_device_map={"user-001": "device-main"}) == expected
 
-    def test_does_not_trigger_known_device(self) -> None:
-        """Transaction from the user's main device should return 0."""
-        tx = _make_transaction(device_id="device-main")
-        assert self.rule.evaluate(tx, user_device_map=self.device_map) == 0
 
-    def test_unknown_user_returns_zero(self) -> None:
-        """User with no device history should return 0 (no false positives)."""
-        tx = _make_transaction(user_id="unknown-user", device_id="any")
-        assert self.rule.evaluate(tx, user_device_map=self.device_map) == 0
+# ────────────────────────────────────────────────────────────────────────────
+# Per-Row Scorer Tests
+# ────────────────────────────────────────────────────────────────────────────
+
+class TestFastEval:
+    """Tests for the closures the engine calls in place of evaluate()."""
+
+    @pytest.mark.parametrize("rule", [
+        HighAmountRule({"threshold": 15000, "points": 50}),
+        OddHoursRule({"points": 30}),
+        VelocityRule({"min_hours": 0.17, "points": 40}),
+        UnusualAmountRule({"ratio_threshold": 3.0, "points": 35}),
+        LocationChangeRule({"max_hours": 2.0, "points": 30}),
+        ForeignTxRule({"points": 25}),
+        NewDeviceRule({"points": 20}),
+    ], ids=repr)
+    def test_fast_eval_matches_evaluate(self, rule) -> None:
+        """Every built-in closure scores exactly like the rule's evaluate()."""
+        device_map = {"user-001": "device-main"}
+        transactions = [
+            _make_transaction(),
+            _make_transaction(amount=15000.0, hours_since_last_tx=0.17),
+            _make_transaction(
+                amount=20000.0, is_odd_hour=1, hours_since_last_tx=0.1,
+                amount_vs_avg_ratio=4.0, location_changed=1, is_foreign_location=1,
+                device_id="device-new",
+            ),
+            _make_transaction(user_id="unknown-user", device_id="device-new"),
+        ]
+        fast_eval = rule.fast_eval
+        assert [fast_eval(tx, user_device_map=device_map) for tx in transactions] == [
+            rule.evaluate(tx, user_device_map=device_map) for tx in transactions
+        ]